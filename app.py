@@ -4,9 +4,6 @@ Agente de IA especializado no Portal Nacional de Contratações Públicas (PNCP)
 Construído com Streamlit, LangChain e OpenAI
 """
 import streamlit as st
-from src.agents import create_agent
-from src.prompts import prompt_loader
-from src.config import settings
 
 
 # Configuração da página
@@ -18,11 +15,34 @@ st.set_page_config(
 )
 
 
+def _build_agent():
+    """
+    Cria um agente por sessão: o chat_history vive no agente, então a
+    instância não pode ser compartilhada entre usuários. A construção é
+    barata mesmo assim — LLM, ferramentas e prompts são memoizados nas
+    camadas inferiores (_bound_llm, _base_system_prompt, fábricas de
+    ferramentas), então só o estado da conversa é novo por sessão.
+    """
+    # Import tardio: evita pagar o custo de importar LangChain/OpenAI no
+    # cold start do Streamlit antes de o agente ser realmente necessário
+    from src.agents import create_agent
+
+    return create_agent()
+
+
+@st.cache_data(show_spinner=False)
+def _welcome_message() -> str:
+    """Carrega a mensagem de boas-vindas uma única vez por processo"""
+    from src.prompts import prompt_loader
+
+    return prompt_loader.get_welcome_message()
+
+
 def initialize_session_state():
     """Inicializa as variáveis de estado da sessão"""
     if "agent" not in st.session_state:
         try:
-            st.session_state.agent = create_agent()
+            st.session_state.agent = _build_agent()
         except ValueError as e:
             st.error("❌ Erro ao inicializar o agente:")
             st.error(str(e))
@@ -32,50 +52,66 @@ def initialize_session_state():
     if "messages" not in st.session_state:
         st.session_state.messages = []
         # Adiciona mensagem de boas-vindas
-        welcome_msg = prompt_loader.get_welcome_message()
+        welcome_msg = _welcome_message()
         st.session_state.messages.append({
             "role": "assistant",
             "content": welcome_msg
         })
 
 
+@st.cache_data(show_spinner=False, max_entries=256)
+def _render_content(content: str) -> str:
+    """
+    Conteúdo de mensagem memoizado por valor: reruns subsequentes reutilizam
+    a entrada em cache ao invés de reprocessar o texto de cada turno antigo
+    """
+    return content
+
+
 def display_chat_history():
     """Exibe o histórico de mensagens do chat"""
     for message in st.session_state.messages:
         with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+            st.markdown(_render_content(message["content"]))
 
 
 def handle_user_input(user_input: str):
     """
     Processa a entrada do usuário e obtém resposta do agente
-    
+
     Args:
         user_input: Mensagem do usuário
     """
-    # Adiciona mensagem do usuário ao histórico
-    st.session_state.messages.append({
-        "role": "user",
-        "content": user_input
-    })
-    
     # Exibe mensagem do usuário
     with st.chat_message("user"):
         st.markdown(user_input)
-    
-    # Obtém resposta do agente
+
+    # Obtém resposta do agente em streaming (tokens renderizados conforme chegam)
     with st.chat_message("assistant"):
-        with st.spinner("🔍 Analisando sua solicitação e consultando o PNCP..."):
-            response = st.session_state.agent.chat(user_input)
-            st.markdown(response)
-    
-    # Adiciona resposta ao histórico
-    st.session_state.messages.append({
-        "role": "assistant",
-        "content": response
-    })
+        response = st.write_stream(st.session_state.agent.chat_stream(user_input))
+
+    # Atualiza o histórico uma única vez, após o turno completo
+    st.session_state.messages.extend([
+        {"role": "user", "content": user_input},
+        {"role": "assistant", "content": response},
+    ])
 
 
+@st.fragment
+def chat_view():
+    """
+    Área do chat isolada em fragment: submissões no chat_input re-executam
+    apenas este bloco, sem reconstruir a sidebar e o restante da página
+    """
+    # Exibe histórico de mensagens
+    display_chat_history()
+
+    # Campo de entrada do usuário
+    if prompt := st.chat_input("Pergunte sobre editais, licitações ou contratações públicas..."):
+        handle_user_input(prompt)
+
+
+@st.fragment
 def sidebar():
     """Cria a barra lateral com configurações e informações"""
     with st.sidebar:
@@ -83,6 +119,8 @@ def sidebar():
         
         st.divider()
         
+        from src.config import settings
+
         # Informações do modelo
         st.subheader("🤖 Modelo Atual")
         st.info(f"**Modelo:** {settings.OPENAI_MODEL}")
@@ -95,23 +133,25 @@ def sidebar():
             st.session_state.agent.clear_history()
             st.session_state.messages = []
             # Adiciona mensagem de boas-vindas novamente
-            welcome_msg = prompt_loader.get_welcome_message()
+            welcome_msg = _welcome_message()
             st.session_state.messages.append({
                 "role": "assistant",
                 "content": welcome_msg
             })
-            st.rerun()
+            # Escopo de app: dentro de um fragment, st.rerun() re-executaria
+            # só a sidebar e o chat_view continuaria mostrando a conversa antiga
+            st.rerun(scope="app")
         
         st.divider()
         
-        # Informações sobre ferramentas
+        # Informações sobre ferramentas (resumos pré-computados no agente)
         st.subheader("🛠️ Ferramentas Disponíveis")
-        tools = st.session_state.agent.tools
-        st.info(f"✅ {len(tools)} ferramenta(s) ativa(s)")
-        for tool in tools:
-            with st.expander(f"📌 **{tool.name}**"):
+        tool_summaries = st.session_state.agent.tool_summaries
+        st.info(f"✅ {len(tool_summaries)} ferramenta(s) ativa(s)")
+        for tool_name, tool_summary in tool_summaries:
+            with st.expander(f"📌 **{tool_name}**"):
                 st.markdown(f"**Descrição:**")
-                st.write(tool.description[:300] + "..." if len(tool.description) > 300 else tool.description)
+                st.write(tool_summary)
         
         st.divider()
         
@@ -164,13 +204,9 @@ def main():
     
     # Barra lateral
     sidebar()
-    
-    # Exibe histórico de mensagens
-    display_chat_history()
-    
-    # Campo de entrada do usuário
-    if prompt := st.chat_input("Pergunte sobre editais, licitações ou contratações públicas..."):
-        handle_user_input(prompt)
+
+    # Histórico de mensagens + campo de entrada do usuário
+    chat_view()
     
     # Rodapé com disclaimer
     st.divider()
@@ -1,8 +1,16 @@
 """
 Módulo de implementação do agente de IA
 """
+import asyncio
+import functools
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
 
@@ -10,6 +18,107 @@ from ..config import settings
 from ..tools import get_all_tools
 from ..prompts import prompt_loader
 
+# Aplica o nível configurado em LOG_LEVEL ao logging uma única vez, no
+# primeiro import do agente (basicConfig é no-op se a aplicação hospedeira
+# já tiver configurado handlers no root logger)
+logging.basicConfig(level=settings.LOG_LEVEL)
+
+logger = logging.getLogger("contrataai.agent")
+
+# Separador usado nos logs de depuração (construído uma única vez)
+_SEP = "=" * 100
+
+# Throttling do streaming: emitir chunks agregados de pelo menos
+# _STREAM_FLUSH_CHARS caracteres, evitando que a UI re-renderize o
+# Markdown acumulado a cada token individual
+_STREAM_FLUSH_CHARS = 64
+
+# Clientes HTTP compartilhados para a API da OpenAI: pool de conexões com
+# keep-alive e HTTP/2, reutilizando o handshake TCP+TLS entre as iterações
+# do loop do agente e entre sessões do Streamlit
+# Orçamento de tempo por turno e detecção de repetição: se o modelo entra em
+# loop repetindo a mesma tool call, o turno é encerrado bem antes de esgotar
+# as max_iterations (cada iteração é um round-trip completo à OpenAI)
+_TURN_TIME_BUDGET_SECS = 30.0
+_MAX_REPEATED_TOOL_CALLS = 3
+
+# Mensagem amigável para turnos que estouram o orçamento de tempo/iterações
+_FALLBACK_MSG = "Desculpe, não consegui completar a tarefa. A consulta pode ser muito complexa ou " \
+                "pode haver um problema temporário. Tente: (1) reformular a pergunta de forma mais simples, " \
+                "(2) dividir em perguntas menores, ou (3) tentar novamente em alguns instantes."
+
+
+def _tool_calls_signature(tool_calls) -> tuple:
+    """Assinatura hasheável de um conjunto de tool calls (nome + argumentos)"""
+    return tuple(sorted((tc["name"], repr(sorted(tc["args"].items()))) for tc in tool_calls))
+
+
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_shared_http = httpx.Client(http2=True, limits=_HTTP_LIMITS)
+_shared_http_async = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+
+
+@functools.lru_cache(maxsize=4)
+def _bound_llm(model_name: str, temperature: float, max_tokens: int):
+    """
+    Memoiza (llm, ferramentas, llm com ferramentas vinculadas) por parâmetros
+    de modelo.
+
+    As ferramentas são estáticas no processo e bind_tools refaz a conversão
+    Pydantic -> JSON Schema de cada uma; com o cache, agentes criados por
+    sessão do Streamlit reutilizam os mesmos objetos.
+    """
+    llm = ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        openai_api_key=settings.OPENAI_API_KEY,
+        http_client=_shared_http,
+        http_async_client=_shared_http_async,
+    )
+    tools = get_all_tools()
+    return llm, tools, llm.bind_tools(tools)
+
+
+@functools.lru_cache(maxsize=1)
+def _base_system_prompt() -> str:
+    """Carrega o prompt base do sistema uma única vez por processo"""
+    return prompt_loader.get_system_prompt()
+
+
+# Template do prompt do sistema compilado uma única vez; a montagem em
+# _system_prompt_for vira uma única chamada de format_map
+_SYS_TMPL = (
+    "{base}\n\n📅 CONTEXTO TEMPORAL IMPORTANTE:\n"
+    "Data atual: {data_atual} (formato API: {data_atual_yyyymmdd})\n"
+    "Ao consultar editais no PNCP, a data final (dataFinal) DEVE ser maior ou igual à data atual.\n"
+    "Para consultas futuras, calcule a data no formato YYYYMMDD a partir de hoje.\n"
+    "Exemplos: 'próximo mês' use uma data 30-60 dias à frente, "
+    "'este mês' use o final do mês atual, 'daqui 30 dias' = {data_30_dias}"
+)
+
+
+@functools.lru_cache(maxsize=2)
+def _system_prompt_for(hoje: date) -> str:
+    """
+    Monta o prompt do sistema com o contexto temporal para o dia informado.
+
+    Memoizado por dia: o sufixo com datas só é reconstruído na virada do dia,
+    e agentes que vivem além da meia-noite não ficam com a data desatualizada.
+    """
+    return _SYS_TMPL.format_map({
+        "base": _base_system_prompt(),
+        "data_atual": hoje.strftime("%d/%m/%Y"),
+        "data_atual_yyyymmdd": hoje.strftime("%Y%m%d"),
+        "data_30_dias": (hoje + timedelta(days=30)).strftime("%Y%m%d"),
+    })
+
+
+@functools.lru_cache(maxsize=2)
+def _system_message_for(hoje: date) -> SystemMessage:
+    """SystemMessage memoizada por dia, evitando reconstruí-la a cada turno"""
+    return SystemMessage(content=_system_prompt_for(hoje))
+
 
 class ConversationalAgent:
     """Agente conversacional com memória e ferramentas"""
@@ -36,37 +145,29 @@ class ConversationalAgent:
         self.temperature = temperature if temperature is not None else settings.TEMPERATURE
         self.max_tokens = max_tokens or settings.MAX_TOKENS
         
-        # Inicializa o modelo LLM
-        self.llm = ChatOpenAI(
-            model=self.model_name,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            openai_api_key=settings.OPENAI_API_KEY,
+        # Inicializa o modelo LLM e as ferramentas (memoizados por parâmetros
+        # de modelo, ver _bound_llm) e índice por nome para despacho O(1)
+        self.llm, self.tools, self.llm_with_tools = _bound_llm(
+            self.model_name, self.temperature, self.max_tokens
         )
-        
-        # Carrega ferramentas
-        self.tools = get_all_tools()
-        
-        # Vincula as ferramentas ao modelo
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
-        
-        # Configura o prompt do sistema com data atual
-        base_system_prompt = prompt_loader.get_system_prompt()
-        hoje = datetime.now()
-        data_atual = hoje.strftime("%d/%m/%Y")
-        data_atual_yyyymmdd = hoje.strftime("%Y%m%d")
-        data_30_dias = (hoje + timedelta(days=30)).strftime("%Y%m%d")
-        
-        self.system_prompt = f"{base_system_prompt}\n\n📅 CONTEXTO TEMPORAL IMPORTANTE:\n" \
-                             f"Data atual: {data_atual} (formato API: {data_atual_yyyymmdd})\n" \
-                             f"Ao consultar editais no PNCP, a data final (dataFinal) DEVE ser maior ou igual à data atual.\n" \
-                             f"Para consultas futuras, calcule a data no formato YYYYMMDD a partir de hoje.\n" \
-                             f"Exemplos: 'próximo mês' use uma data 30-60 dias à frente, " \
-                             f"'este mês' use o final do mês atual, 'daqui 30 dias' = {data_30_dias}"
-        
-        # Inicializa a memória da conversa
-        self.chat_history = []
-    
+        self._tool_map = {t.name: t for t in self.tools}
+
+        # Resumos (nome, descrição truncada) pré-computados para a sidebar,
+        # evitando refazer o slice das descrições a cada rerun do Streamlit
+        self.tool_summaries = [
+            (t.name, (t.description[:300] + "...") if len(t.description) > 300 else t.description)
+            for t in self.tools
+        ]
+
+        # Inicializa a memória da conversa (mantém últimas 20 mensagens,
+        # com descarte O(1) das mais antigas)
+        self.chat_history = deque(maxlen=20)
+
+    @property
+    def system_prompt(self) -> str:
+        """Prompt do sistema com o contexto temporal do dia atual"""
+        return _system_prompt_for(date.today())
+
     def _execute_tool(self, tool_name: str, tool_input: Any) -> str:
         """
         Executa uma ferramenta
@@ -78,29 +179,26 @@ class ConversationalAgent:
         Returns:
             Resultado da ferramenta
         """
-        print(f"\n🔧 EXECUTANDO FERRAMENTA: {tool_name}")
-        print(f"📥 Parâmetros: {tool_input}")
-        
-        for tool in self.tools:
-            if tool.name == tool_name:
-                try:
-                    # Usar invoke() ao invés de func() para que o LangChain
-                    # desempacote corretamente os parâmetros do dicionário
-                    result = tool.invoke(tool_input)
-                    # Mostra preview do resultado (primeiras 200 caracteres)
-                    preview = result[:200] + "..." if len(result) > 200 else result
-                    print(f"📤 Resultado (preview): {preview}")
-                    return result
-                except Exception as e:
-                    error_msg = f"Erro ao executar ferramenta: {str(e)}"
-                    print(f"❌ {error_msg}")
-                    print(f"🔍 Debug - tool_input type: {type(tool_input)}")
-                    print(f"🔍 Debug - tool_input value: {tool_input}")
-                    return error_msg
-        
-        error_msg = f"Ferramenta '{tool_name}' não encontrada."
-        print(f"❌ {error_msg}")
-        return error_msg
+        logger.debug("🔧 Executando ferramenta: %s | parâmetros: %s", tool_name, tool_input)
+
+        tool = self._tool_map.get(tool_name)
+        if tool is None:
+            error_msg = f"Ferramenta '{tool_name}' não encontrada."
+            logger.error("❌ %s", error_msg)
+            return error_msg
+
+        try:
+            # Usar invoke() ao invés de func() para que o LangChain
+            # desempacote corretamente os parâmetros do dicionário
+            result = tool.invoke(tool_input)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Preview do resultado (primeiras 200 caracteres)
+                logger.debug("📤 Resultado (preview): %s", result[:200])
+            return result
+        except Exception as e:
+            error_msg = f"Erro ao executar ferramenta: {str(e)}"
+            logger.error("❌ %s | tool_input (%s): %s", error_msg, type(tool_input), tool_input)
+            return error_msg
     
     def chat(self, user_input: str, max_iterations: int = 15) -> str:
         """
@@ -113,94 +211,296 @@ class ConversationalAgent:
         Returns:
             Resposta do agente
         """
-        print("\n" + "="*100)
-        print("🤖 AGENTE CONTRATAI - INICIANDO PROCESSAMENTO")
-        print("="*100)
-        print(f"💬 Pergunta do usuário: {user_input}")
-        print(f"⚙️  Max iterações: {max_iterations}")
-        print("="*100)
-        
+        logger.debug(_SEP)
+        logger.debug("🤖 AGENTE CONTRATAI - INICIANDO PROCESSAMENTO")
+        logger.debug("💬 Pergunta do usuário: %s | max iterações: %s", user_input, max_iterations)
+
         try:
-            # Constrói a lista de mensagens com o histórico
-            messages = [SystemMessage(content=self.system_prompt)]
-            messages.extend(self.chat_history)
-            messages.append(HumanMessage(content=user_input))
-            
+            # Constrói a lista de mensagens com o histórico, reutilizando a
+            # SystemMessage memoizada e uma única HumanMessage por turno
+            human_msg = HumanMessage(content=user_input)
+            messages = [_system_message_for(date.today()), *self.chat_history, human_msg]
+
+            # Controle de orçamento de tempo e detecção de repetição
+            inicio = time.monotonic()
+            assinatura_anterior = None
+            repeticoes = 1
+
             # Loop de execução do agente
             for i in range(max_iterations):
-                print(f"\n🔄 ITERAÇÃO {i+1}/{max_iterations}")
-                print("-" * 100)
-                
                 # Invoca o modelo com as ferramentas
-                print(f"🧠 Invocando modelo {self.model_name}...")
+                logger.debug("🔄 Iteração %d/%d - invocando modelo %s", i + 1, max_iterations, self.model_name)
                 response = self.llm_with_tools.invoke(messages)
-                
+
                 # Verifica se há tool calls
                 if not response.tool_calls:
                     # Não há mais ferramentas a chamar, retorna a resposta
-                    print("\n✅ RESPOSTA FINAL GERADA (sem tool calls)")
                     output = response.content
-                    print(f"💭 Resposta: {output[:150]}{'...' if len(output) > 150 else ''}")
-                    
-                    # Adiciona à memória
-                    self.chat_history.append(HumanMessage(content=user_input))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("✅ Resposta final gerada: %s", output[:150])
+
+                    # Adiciona à memória (o deque descarta as mensagens mais antigas)
+                    self.chat_history.append(human_msg)
+                    self.chat_history.append(AIMessage(content=output))
+
+                    logger.debug("✨ Processamento concluído com sucesso")
+                    return output
+
+                # Encerra o turno cedo se o orçamento de tempo estourou ou se o
+                # modelo está em loop repetindo as mesmas tool calls
+                if time.monotonic() - inicio > _TURN_TIME_BUDGET_SECS:
+                    logger.warning("⚠️  Orçamento de tempo do turno esgotado (%.0fs)", _TURN_TIME_BUDGET_SECS)
+                    return _FALLBACK_MSG
+
+                assinatura = _tool_calls_signature(response.tool_calls)
+                if assinatura == assinatura_anterior:
+                    repeticoes += 1
+                    if repeticoes >= _MAX_REPEATED_TOOL_CALLS:
+                        logger.warning("⚠️  Modelo repetindo as mesmas tool calls; encerrando o turno")
+                        return _FALLBACK_MSG
+                else:
+                    assinatura_anterior = assinatura
+                    repeticoes = 1
+
+                # Adiciona a resposta do modelo às mensagens
+                logger.debug("🛠️  Modelo solicitou %d chamada(s) de ferramenta", len(response.tool_calls))
+                messages.append(response)
+
+                # Executa as ferramentas chamadas em paralelo (são consultas de
+                # rede independentes, então a latência vira o máximo dos RTTs
+                # ao invés da soma)
+                with ThreadPoolExecutor(max_workers=len(response.tool_calls)) as pool:
+                    futures = [
+                        pool.submit(self._execute_tool, tc["name"], tc["args"])
+                        for tc in response.tool_calls
+                    ]
+
+                    # Os resultados são anexados na ordem original das tool calls,
+                    # conforme exigido pelo protocolo de ferramentas da OpenAI
+                    for tool_call, future in zip(response.tool_calls, futures):
+                        messages.append(
+                            ToolMessage(
+                                content=future.result(),
+                                tool_call_id=tool_call["id"],
+                            )
+                        )
+            
+            # Se chegou aqui, atingiu o número máximo de iterações
+            logger.warning("⚠️  Limite de iterações atingido (%d)", max_iterations)
+            return _FALLBACK_MSG
+
+        except Exception as e:
+            logger.exception("❌ Erro ao processar mensagem: %s", e)
+
+            # Retorna mensagem de erro amigável
+            agent_prompts = prompt_loader.get_agent_prompts()
+            return agent_prompts.get("error_message", "Desculpe, ocorreu um erro.")
+    
+    def chat_stream(self, user_input: str, max_iterations: int = 15):
+        """
+        Versão geradora de chat(): emite a resposta final em chunks
+        agrupados, adequada a st.write_stream
+
+        O texto de cada iteração fica retido até o fim do stream daquela
+        resposta: só quando se sabe que não há tool calls o texto é emitido
+        ao chamador. Texto que acompanha tool calls em uma resposta mista
+        nunca vaza para a UI — o que é exibido é exatamente o que entra no
+        histórico da conversa.
+
+        Args:
+            user_input: Mensagem do usuário
+            max_iterations: Número máximo de iterações (padrão: 15 para consultas complexas)
+
+        Yields:
+            Trechos (chunks) do texto da resposta do agente
+        """
+        try:
+            # Constrói a lista de mensagens com o histórico
+            human_msg = HumanMessage(content=user_input)
+            messages = [_system_message_for(date.today()), *self.chat_history, human_msg]
+
+            # Controle de orçamento de tempo e detecção de repetição
+            inicio = time.monotonic()
+            assinatura_anterior = None
+            repeticoes = 1
+
+            # Loop de execução do agente
+            for i in range(max_iterations):
+                logger.debug("🔄 Iteração %d/%d - invocando modelo %s (stream)", i + 1, max_iterations, self.model_name)
+
+                # Agrega os chunks para reconstruir a resposta completa. O
+                # texto fica retido até o fim do stream da iteração: se as
+                # tool calls chegam depois do texto (resposta mista), nada
+                # foi emitido ao chamador — só a resposta final (sem tool
+                # calls) é repassada, e o exibido coincide com o memorizado
+                response = None
+                partes = []
+                for chunk in self.llm_with_tools.stream(messages):
+                    response = chunk if response is None else response + chunk
+                    if chunk.content:
+                        partes.append(chunk.content)
+
+                if response is None:
+                    break
+
+                # Sem tool calls: emite a resposta final, agrupando as partes
+                # em chunks de pelo menos _STREAM_FLUSH_CHARS para que o
+                # renderizador não re-parseie o Markdown a cada token
+                if not response.tool_calls:
+                    buffer = []
+                    buffer_len = 0
+                    for parte in partes:
+                        buffer.append(parte)
+                        buffer_len += len(parte)
+                        if buffer_len >= _STREAM_FLUSH_CHARS:
+                            yield "".join(buffer)
+                            buffer.clear()
+                            buffer_len = 0
+                    if buffer:
+                        yield "".join(buffer)
+
+                    output = "".join(partes) or response.content
+
+                    # Adiciona à memória (o deque descarta as mensagens mais antigas)
+                    self.chat_history.append(human_msg)
+                    self.chat_history.append(AIMessage(content=output))
+
+                    logger.debug("✨ Processamento concluído com sucesso")
+                    return
+
+                # Encerra o turno cedo se o orçamento de tempo estourou ou se o
+                # modelo está em loop repetindo as mesmas tool calls
+                if time.monotonic() - inicio > _TURN_TIME_BUDGET_SECS:
+                    logger.warning("⚠️  Orçamento de tempo do turno esgotado (%.0fs)", _TURN_TIME_BUDGET_SECS)
+                    yield _FALLBACK_MSG
+                    return
+
+                assinatura = _tool_calls_signature(response.tool_calls)
+                if assinatura == assinatura_anterior:
+                    repeticoes += 1
+                    if repeticoes >= _MAX_REPEATED_TOOL_CALLS:
+                        logger.warning("⚠️  Modelo repetindo as mesmas tool calls; encerrando o turno")
+                        yield _FALLBACK_MSG
+                        return
+                else:
+                    assinatura_anterior = assinatura
+                    repeticoes = 1
+
+                # Adiciona a resposta do modelo às mensagens
+                logger.debug("🛠️  Modelo solicitou %d chamada(s) de ferramenta", len(response.tool_calls))
+                messages.append(response)
+
+                # Executa as ferramentas chamadas em paralelo
+                with ThreadPoolExecutor(max_workers=len(response.tool_calls)) as pool:
+                    futures = [
+                        pool.submit(self._execute_tool, tc["name"], tc["args"])
+                        for tc in response.tool_calls
+                    ]
+
+                    for tool_call, future in zip(response.tool_calls, futures):
+                        messages.append(
+                            ToolMessage(
+                                content=future.result(),
+                                tool_call_id=tool_call["id"],
+                            )
+                        )
+
+            else:
+                # Atingiu o número máximo de iterações
+                logger.warning("⚠️  Limite de iterações atingido (%d)", max_iterations)
+                yield _FALLBACK_MSG
+
+        except Exception as e:
+            logger.exception("❌ Erro ao processar mensagem: %s", e)
+
+            # Retorna mensagem de erro amigável
+            agent_prompts = prompt_loader.get_agent_prompts()
+            yield agent_prompts.get("error_message", "Desculpe, ocorreu um erro.")
+
+    async def achat(self, user_input: str, max_iterations: int = 15) -> str:
+        """
+        Versão assíncrona de chat(): usa ainvoke no modelo e executa as
+        ferramentas em paralelo, liberando o event loop enquanto aguarda
+        as respostas da OpenAI e do PNCP
+
+        Args:
+            user_input: Mensagem do usuário
+            max_iterations: Número máximo de iterações (padrão: 15 para consultas complexas)
+
+        Returns:
+            Resposta do agente
+        """
+        try:
+            # Constrói a lista de mensagens com o histórico, reutilizando a
+            # SystemMessage memoizada e uma única HumanMessage por turno
+            human_msg = HumanMessage(content=user_input)
+            messages = [_system_message_for(date.today()), *self.chat_history, human_msg]
+
+            # Controle de orçamento de tempo e detecção de repetição
+            inicio = time.monotonic()
+            assinatura_anterior = None
+            repeticoes = 1
+
+            # Loop de execução do agente
+            for i in range(max_iterations):
+                # Invoca o modelo com as ferramentas sem bloquear o event loop
+                response = await self.llm_with_tools.ainvoke(messages)
+
+                # Verifica se há tool calls
+                if not response.tool_calls:
+                    output = response.content
+
+                    # Adiciona à memória (o deque descarta as mensagens mais antigas)
+                    self.chat_history.append(human_msg)
                     self.chat_history.append(AIMessage(content=output))
-                    
-                    # Limita o tamanho da memória (mantém últimas 20 mensagens)
-                    if len(self.chat_history) > 20:
-                        self.chat_history = self.chat_history[-20:]
-                    
-                    print("\n" + "="*100)
-                    print("✨ PROCESSAMENTO CONCLUÍDO COM SUCESSO")
-                    print("="*100 + "\n")
+
                     return output
-                
+
+                # Encerra o turno cedo se o orçamento de tempo estourou ou se o
+                # modelo está em loop repetindo as mesmas tool calls
+                if time.monotonic() - inicio > _TURN_TIME_BUDGET_SECS:
+                    logger.warning("⚠️  Orçamento de tempo do turno esgotado (%.0fs)", _TURN_TIME_BUDGET_SECS)
+                    return _FALLBACK_MSG
+
+                assinatura = _tool_calls_signature(response.tool_calls)
+                if assinatura == assinatura_anterior:
+                    repeticoes += 1
+                    if repeticoes >= _MAX_REPEATED_TOOL_CALLS:
+                        logger.warning("⚠️  Modelo repetindo as mesmas tool calls; encerrando o turno")
+                        return _FALLBACK_MSG
+                else:
+                    assinatura_anterior = assinatura
+                    repeticoes = 1
+
                 # Adiciona a resposta do modelo às mensagens
-                print(f"\n🛠️  Modelo solicitou {len(response.tool_calls)} chamada(s) de ferramenta")
                 messages.append(response)
-                
-                # Executa as ferramentas chamadas
-                for idx, tool_call in enumerate(response.tool_calls, 1):
-                    print(f"\n📌 Tool Call {idx}/{len(response.tool_calls)}")
-                    tool_name = tool_call["name"]
-                    tool_input = tool_call["args"]
-                    tool_call_id = tool_call["id"]
-                    
-                    # Executa a ferramenta
-                    tool_output = self._execute_tool(tool_name, tool_input)
-                    
-                    # Adiciona o resultado da ferramenta às mensagens como ToolMessage
+
+                # Executa as ferramentas em threads, todas em paralelo
+                outputs = await asyncio.gather(*[
+                    asyncio.to_thread(self._execute_tool, tc["name"], tc["args"])
+                    for tc in response.tool_calls
+                ])
+
+                # Resultados na ordem original das tool calls
+                for tool_call, tool_output in zip(response.tool_calls, outputs):
                     messages.append(
                         ToolMessage(
                             content=tool_output,
-                            tool_call_id=tool_call_id,
+                            tool_call_id=tool_call["id"],
                         )
                     )
-            
+
             # Se chegou aqui, atingiu o número máximo de iterações
-            print("\n" + "="*100)
-            print(f"⚠️  LIMITE DE ITERAÇÕES ATINGIDO ({max_iterations})")
-            print("="*100 + "\n")
-            erro_msg = "Desculpe, não consegui completar a tarefa. A consulta pode ser muito complexa ou " \
-                      "pode haver um problema temporário. Tente: (1) reformular a pergunta de forma mais simples, " \
-                      "(2) dividir em perguntas menores, ou (3) tentar novamente em alguns instantes."
-            return erro_msg
-        
-        except Exception as e:
-            error_msg = f"Erro ao processar mensagem: {str(e)}"
-            print("\n" + "="*100)
-            print(f"❌ ERRO NO PROCESSAMENTO")
-            print("="*100)
-            print(f"💥 {error_msg}")
-            print("="*100 + "\n")
-            
+            return _FALLBACK_MSG
+
+        except Exception:
             # Retorna mensagem de erro amigável
             agent_prompts = prompt_loader.get_agent_prompts()
             return agent_prompts.get("error_message", "Desculpe, ocorreu um erro.")
-    
+
     def clear_history(self):
         """Limpa o histórico da conversa"""
-        self.chat_history = []
+        self.chat_history.clear()
     
     def get_history(self) -> List[Dict[str, str]]:
         """
@@ -209,13 +509,12 @@ class ConversationalAgent:
         Returns:
             Lista com o histórico formatado
         """
-        history = []
-        for msg in self.chat_history:
-            if isinstance(msg, HumanMessage):
-                history.append({"role": "user", "content": msg.content})
-            elif isinstance(msg, AIMessage):
-                history.append({"role": "assistant", "content": msg.content})
-        return history
+        # Apenas HumanMessage ("human") e AIMessage ("ai") entram no histórico;
+        # o atributo type já vem pré-computado pelo LangChain, dispensando isinstance
+        return [
+            {"role": "user" if msg.type == "human" else "assistant", "content": msg.content}
+            for msg in self.chat_history
+        ]
 
 
 def create_agent(
@@ -3,24 +3,29 @@ Módulo de configurações do aplicativo.
 Carrega variáveis de ambiente do arquivo .env
 """
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
 
-# Carrega variáveis de ambiente do arquivo .env
-load_dotenv()
+from dotenv import load_dotenv
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Classe para gerenciar as configurações do aplicativo"""
-    
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
-    MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "2000"))
-    
-    @classmethod
-    def validate(cls) -> bool:
+    """
+    Configurações imutáveis do aplicativo.
+
+    frozen + slots: sem __dict__ por instância, acesso a atributo mais rápido
+    no caminho quente do agente e garantia de que nada muda após a carga.
+    """
+
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str
+    TEMPERATURE: float
+    MAX_TOKENS: int
+    LOG_LEVEL: str
+
+    def validate(self) -> bool:
         """Valida se as configurações necessárias estão presentes"""
-        if not cls.OPENAI_API_KEY:
+        if not self.OPENAI_API_KEY:
             raise ValueError(
                 "OPENAI_API_KEY não configurada. "
                 "Por favor, configure a variável no arquivo .env"
@@ -28,5 +33,17 @@ class Settings:
         return True
 
 
-# Instância global de configurações
-settings = Settings()
+def _load() -> Settings:
+    """Lê o .env e os getenv/casts uma única vez, congelando o resultado"""
+    load_dotenv()
+    return Settings(
+        OPENAI_API_KEY=os.getenv("OPENAI_API_KEY", ""),
+        OPENAI_MODEL=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        TEMPERATURE=float(os.getenv("TEMPERATURE", "0.7")),
+        MAX_TOKENS=int(os.getenv("MAX_TOKENS", "2000")),
+        LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+    )
+
+
+# Instância global de configurações (parse do .env acontece uma única vez aqui)
+settings = _load()
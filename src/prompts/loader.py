@@ -1,11 +1,13 @@
 """
 Módulo para carregar prompts de arquivos JSON
 """
-import json
+import functools
 import os
 from typing import Dict, Any
 from pathlib import Path
 
+import orjson
+
 
 class PromptLoader:
     """Classe para carregar e gerenciar prompts de arquivos JSON"""
@@ -24,13 +26,17 @@ class PromptLoader:
         else:
             self.prompts_dir = Path(prompts_dir)
     
+    @functools.lru_cache(maxsize=8)
     def load_prompt_file(self, filename: str) -> Dict[str, Any]:
         """
         Carrega um arquivo JSON de prompt
-        
+
+        Os arquivos de prompt são estáticos, então o resultado é memoizado
+        por nome de arquivo para evitar reabrir e re-parsear o JSON a cada chamada.
+
         Args:
             filename: Nome do arquivo JSON (com ou sem extensão)
-        
+
         Returns:
             Dicionário com os prompts carregados
         """
@@ -40,13 +46,14 @@ class PromptLoader:
         filepath = self.prompts_dir / filename
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # orjson parseia direto dos bytes, sem o overhead do json stdlib
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Arquivo de prompt não encontrado: {filepath}"
             )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(
                 f"Erro ao decodificar JSON do arquivo {filepath}: {e}"
             )
@@ -2,22 +2,29 @@
 Módulo de ferramentas do agente ContratAI
 Organizado em arquivos separados para melhor manutenção
 """
+import functools
 from typing import List
 from langchain_core.tools import StructuredTool
 
 # Importar ferramentas dos módulos separados
+from .http_session import PNCP_SESSION
 from .uf_tools import create_consulta_uf_tool, consultar_uf
 from .municipio_tools import create_consulta_municipio_tool, consultar_municipio
 from .modalidade_tools import create_consulta_modalidade_tool, consultar_modalidade
 from .pncp_tools import create_editais_pncp_tool, consultar_editais_pncp, test_pncp_consultation
 
 
+@functools.lru_cache(maxsize=1)
 def get_all_tools() -> List[StructuredTool]:
     """
     Retorna todas as ferramentas disponíveis para o agente ContratAI
-    
+
+    As instâncias de StructuredTool são construídas uma única vez por
+    processo (validação pydantic e geração de schema não são refeitas em
+    re-inicializações do agente).
+
     Returns:
-        Lista com todas as ferramentas: ConsultarUF, ConsultarMunicipio, 
+        Lista com todas as ferramentas: ConsultarUF, ConsultarMunicipio,
         ConsultarModalidade e ConsultarEditaisPNCP
     """
     return [
@@ -45,5 +52,6 @@ __all__ = [
     "consultar_editais_pncp",
     
     # Utilitários
-    "test_pncp_consultation"
+    "test_pncp_consultation",
+    "PNCP_SESSION",
 ]
@@ -3,92 +3,291 @@ Ferramentas para consulta ao Portal Nacional de Contratações Públicas (PNCP)
 """
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
+import atexit
+import bisect
+import functools
+import threading
+import httpx
+import orjson
 import requests
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
 from typing import Optional
 import json
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
 
+# Implementação canônica das modalidades vive em modalidade_tools; este módulo
+# apenas re-exporta para manter compatível quem ainda importa daqui (evita
+# duplicar a construção das classes pydantic e os dados em memória).
+from .modalidade_tools import (
+    ConsultaModalidadeInput,
+    consultar_modalidade,
+    create_consulta_modalidade_tool,
+    obter_modalidades_contratacao,
+)
 
+try:
+    # Opcional: cache binário do dataset de municípios (parse ~2x mais rápido
+    # que JSON). Sem msgpack instalado tudo segue funcionando via JSON.
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Respostas compactas por padrão: o consumidor é o LLM, que não precisa de
+# JSON identado (indentação quase dobra os bytes e o custo de serialização).
+# Defina PNCP_TOOL_PRETTY=1 para saída identada em depuração.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS |     (orjson.OPT_INDENT_2 if os.getenv("PNCP_TOOL_PRETTY") == "1" else 0)
+
+
+def _dumps(obj) -> str:
+    """Serializa uma resposta de ferramenta (orjson, compacto por padrão)"""
+    return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': '*/*',
+}
+
+# Sessão HTTP compartilhada: reutiliza conexões TCP/TLS com a API do PNCP
+# (evita um handshake completo por chamada) e centraliza retries com backoff
+# para os erros transitórios de gateway comuns no portal.
+_SESSION = requests.Session()
+_SESSION.headers.update(_DEFAULT_HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# Cliente assíncrono compartilhado: usado pela variante async da ferramenta
+# de editais para não bloquear o event loop durante as chamadas ao PNCP.
+# HTTP/2 multiplexa requisições concorrentes sobre uma única conexão TLS.
+_ACLIENT = httpx.AsyncClient(http2=True, timeout=30, headers=_DEFAULT_HEADERS)
+
+
+def _fechar_aclient():
+    """Fecha o cliente assíncrono compartilhado na saída do processo"""
+    import asyncio
+    try:
+        asyncio.run(_ACLIENT.aclose())
+    except Exception:
+        pass
+
+
+atexit.register(_fechar_aclient)
+
+# Remove a pontuação de CNPJs em uma única passada, sem strings intermediárias
+_CNPJ_TABLE = str.maketrans("", "", "./-")
+
+# Cache de respostas do PNCP com TTL curto: o agente frequentemente repete a
+# mesma consulta dentro de um turno (ou em turnos consecutivos), e os dados do
+# portal não mudam em janelas de segundos. Apenas respostas 200 são cacheadas.
+_PNCP_CACHE: TTLCache = TTLCache(maxsize=256, ttl=60)
+_PNCP_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def carregar_estados_brasil():
-    """Carrega os dados dos estados brasileiros do arquivo JSON"""
+    """
+    Carrega os dados dos estados brasileiros do arquivo JSON
+
+    O resultado é memoizado: os dados são estáticos e o parse do arquivo
+    acontece uma única vez por processo, não a cada chamada de ferramenta.
+    """
     try:
         # Caminho relativo ao arquivo atual
         current_dir = Path(__file__).parent
         json_path = current_dir.parent / "data" / "estados_brasil.json"
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         return []
 
 
+@functools.lru_cache(maxsize=1)
 def carregar_municipios_brasil():
-    """Carrega os dados dos municípios brasileiros do arquivo JSON"""
+    """
+    Carrega os dados dos municípios brasileiros do arquivo JSON
+
+    O resultado é memoizado: o arquivo tem milhares de entradas e o parse
+    acontece uma única vez por processo, não a cada chamada de ferramenta.
+
+    Com msgpack disponível, um cache binário é gerado ao lado do JSON na
+    primeira carga e preferido nas seguintes (se não estiver desatualizado);
+    o formato binário decodifica mais rápido que o parse de JSON.
+    """
     try:
         # Caminho relativo ao arquivo atual
         current_dir = Path(__file__).parent
         json_path = current_dir.parent / "data" / "municipios.json"
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        msgpack_path = json_path.with_suffix(".msgpack")
+
+        if msgpack is not None:
+            try:
+                if (msgpack_path.exists()
+                        and msgpack_path.stat().st_mtime >= json_path.stat().st_mtime):
+                    with open(msgpack_path, 'rb') as f:
+                        return msgpack.unpackb(f.read())
+            except Exception:
+                pass  # cache binário corrompido/ilegível: recai no JSON
+
+        with open(json_path, 'rb') as f:
+            dados = orjson.loads(f.read())
+
+        if msgpack is not None:
+            try:
+                msgpack_path.write_bytes(msgpack.packb(dados))
+            except Exception:
+                pass  # diretório somente leitura etc.: cache é melhor esforço
+
+        return dados
     except Exception as e:
         return []
 
 
-def obter_modalidades_contratacao():
-    """Retorna o mapeamento de modalidades de contratação do PNCP"""
-    return [
-        {"codigo": 1, "nome": "Leilão - Eletrônico", "tipo": "Leilão"},
-        {"codigo": 4, "nome": "Concorrência - Eletrônica", "tipo": "Concorrência"},
-        {"codigo": 5, "nome": "Concorrência - Presencial", "tipo": "Concorrência"},
-        {"codigo": 6, "nome": "Pregão - Eletrônico", "tipo": "Pregão"},
-        {"codigo": 7, "nome": "Pregão - Presencial", "tipo": "Pregão"},
-        {"codigo": 8, "nome": "Dispensa", "tipo": "Dispensa"},
-        {"codigo": 9, "nome": "Inexigibilidade", "tipo": "Inexigibilidade"},
-        {"codigo": 11, "nome": "Pré-qualificação", "tipo": "Pré-qualificação"},
-        {"codigo": 12, "nome": "Credenciamento", "tipo": "Credenciamento"},
-        {"codigo": 13, "nome": "Leilão - Presencial", "tipo": "Leilão"},
-    ]
+@functools.lru_cache(maxsize=1)
+def _municipios_view():
+    """
+    Visão achatada dos municípios, no formato de resposta da ferramenta.
+
+    A cadeia microrregiao -> mesorregiao -> UF é percorrida uma única vez por
+    município na carga; o caminho de resposta apenas seleciona entradas desta
+    lista, sem refazer caminhadas em dicts aninhados a cada chamada.
+    """
+    view = []
+    for m in carregar_municipios_brasil():
+        micro = m.get("microrregiao") or {}
+        meso = micro.get("mesorregiao") or {}
+        uf = meso.get("UF") or {}
+        view.append({
+            "id": m["id"],
+            "nome": m["nome"],
+            "uf": {
+                "id": uf.get("id"),
+                "sigla": uf.get("sigla"),
+                "nome": uf.get("nome")
+            },
+            "microrregiao": micro.get("nome"),
+            "mesorregiao": meso.get("nome")
+        })
+    return view
 
 
-def consultar_modalidade(nome: Optional[str] = None) -> str:
+@functools.lru_cache(maxsize=1)
+def _indices_municipios_por_uf():
     """
-    Consulta informações sobre modalidades de contratação do PNCP
-    
-    Args:
-        nome: Nome completo ou parcial da modalidade (ex: 'Pregão', 'Eletrônico', 'Dispensa')
-    
-    Returns:
-        Informações da(s) modalidade(s) em formato JSON string
+    Constrói índices invertidos {uf_id: [indices]} e {uf_sigla: [indices]}
+    apontando para a visão achatada, para lookup O(1) nas consultas por UF.
     """
-    
-    modalidades = obter_modalidades_contratacao()
-    
-    if nome:
-        # Busca parcial, case-insensitive
-        nome_lower = nome.lower().strip()
-        resultados = [
-            m for m in modalidades 
-            if nome_lower in m["nome"].lower() or nome_lower in m["tipo"].lower()
-        ]
-    else:
-        # Se não especificar filtro, retornar todas
-        resultados = modalidades
-    
-    if resultados:
-        return json.dumps({
-            "success": True,
-            "total_encontrados": len(resultados),
-            "modalidades": resultados
-        }, ensure_ascii=False, indent=2)
-    else:
-        return json.dumps({
-            "success": False,
-            "message": "Nenhuma modalidade encontrada com os critérios especificados",
-            "modalidades_disponiveis": modalidades
-        }, ensure_ascii=False, indent=2)
+    por_id = defaultdict(list)
+    por_sigla = defaultdict(list)
+    for idx, m in enumerate(_municipios_view()):
+        uf = m["uf"]
+        if uf["id"] is not None:
+            por_id[uf["id"]].append(idx)
+            por_sigla[uf["sigla"]].append(idx)
+    return dict(por_id), dict(por_sigla)
+
+
+@functools.lru_cache(maxsize=1)
+def _municipios_por_id():
+    """Índice {codigo_ibge: indice na visão achatada} para lookup O(1) por id"""
+    return {m["id"]: idx for idx, m in enumerate(_municipios_view())}
+
+
+@functools.lru_cache(maxsize=1)
+def _estados_por_id():
+    """Índice {id: estado} para lookup O(1) por id"""
+    return {e["id"]: e for e in carregar_estados_brasil()}
+
+
+@functools.lru_cache(maxsize=1)
+def _estados_por_sigla():
+    """Índice {sigla: estado} para lookup O(1) por sigla"""
+    return {e["sigla"]: e for e in carregar_estados_brasil()}
+
+
+@functools.lru_cache(maxsize=1)
+def _estados_nomes_lower():
+    """
+    Lista paralela a carregar_estados_brasil() com (nome, regiao.nome) já em
+    minúsculas, evitando re-minusculizar as mesmas strings a cada consulta.
+    """
+    return [(e["nome"].lower(), e["regiao"]["nome"].lower()) for e in carregar_estados_brasil()]
+
+
+@functools.lru_cache(maxsize=1)
+def _todos_estados_json() -> str:
+    """Resposta pré-serializada de consultar_uf sem filtros (sempre idêntica)"""
+    estados = carregar_estados_brasil()
+    return _dumps({
+        "success": True,
+        "total_encontrados": len(estados),
+        "estados": estados
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _indice_nomes_municipios():
+    """
+    Pré-computa os nomes de municípios em minúsculas e um índice invertido de
+    trigramas {trigrama: set(indices)}.
+
+    Buscas por substring com 3+ caracteres intersectam os conjuntos de
+    candidatos dos trigramas da consulta antes da verificação final com `in`,
+    reduzindo drasticamente o número de comparações; os nomes não são mais
+    re-minusculizados a cada chamada.
+    """
+    nomes_lower = [m["nome"].lower() for m in carregar_municipios_brasil()]
+    trigramas = defaultdict(set)
+    for idx, nome in enumerate(nomes_lower):
+        for i in range(len(nome) - 2):
+            trigramas[nome[i:i + 3]].add(idx)
+    return nomes_lower, dict(trigramas)
+
+
+@functools.lru_cache(maxsize=1)
+def _blob_nomes_municipios():
+    """
+    Empacota todos os nomes minúsculos em um único buffer de bytes separado
+    por NUL, com a lista de offsets iniciais de cada nome.
+
+    Consultas curtas demais para o índice de trigramas (< 3 caracteres) são
+    resolvidas com bytes.find sobre o buffer — uma varredura em C ao invés de
+    ~5500 iterações do interpretador com um `in` por nome.
+    """
+    nomes_lower, _ = _indice_nomes_municipios()
+    encoded = [n.encode() for n in nomes_lower]
+    offsets = []
+    pos = 0
+    for nome in encoded:
+        offsets.append(pos)
+        pos += len(nome) + 1  # +1 pelo separador NUL
+    return b"\x00".join(encoded), offsets
+
+
+def _busca_nomes_curtos(nome_lower: str):
+    """
+    Gera os índices de municípios cujo nome contém a substring curta, na
+    ordem do dataset, usando busca C-level no buffer único de nomes.
+    """
+    blob, offsets = _blob_nomes_municipios()
+    agulha = nome_lower.encode()
+    anterior = -1
+    pos = blob.find(agulha)
+    while pos != -1:
+        idx = bisect.bisect_right(offsets, pos) - 1
+        if idx != anterior:
+            yield idx
+            anterior = idx
+        pos = blob.find(agulha, pos + 1)
 
 
 def consultar_municipio(
@@ -113,82 +312,70 @@ def consultar_municipio(
     municipios = carregar_municipios_brasil()
     
     if not municipios:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": "Não foi possível carregar os dados dos municípios"
-        }, ensure_ascii=False, indent=2)
+        })
     
-    resultados = []
-    
-    # Filtrar por ID (código IBGE)
+    view = _municipios_view()
+    indices_resultado = []
+
+    # Filtrar por ID (código IBGE) via índice O(1)
     if id is not None:
-        resultados = [m for m in municipios if m["id"] == id]
-    
+        hit = _municipios_por_id().get(id)
+        indices_resultado = [hit] if hit is not None else []
+
     # Filtrar por nome (busca parcial, case-insensitive)
     elif nome:
         nome_lower = nome.lower().strip()
-        resultados = [m for m in municipios if nome_lower in m["nome"].lower()]
+        nomes_lower, trigramas = _indice_nomes_municipios()
+
+        if len(nome_lower) >= 3:
+            # Intersecção dos candidatos por trigrama; a verificação final
+            # com `in` elimina falsos positivos de trigramas não contíguos
+            candidatos = None
+            for i in range(len(nome_lower) - 2):
+                conjunto = trigramas.get(nome_lower[i:i + 3])
+                if not conjunto:
+                    candidatos = set()
+                    break
+                candidatos = conjunto if candidatos is None else candidatos & conjunto
+            indices = (idx for idx in sorted(candidatos) if nome_lower in nomes_lower[idx])
+        else:
+            # Consultas curtas: busca C-level no buffer único de nomes
+            indices = _busca_nomes_curtos(nome_lower)
+
         # Limitar resultados para evitar retornar muitos municípios
-        if len(resultados) > 50:
-            resultados = resultados[:50]
-    
-    # Filtrar por UF (ID ou sigla)
+        indices_resultado = [idx for idx, _ in zip(indices, range(50))]
+
+    # Filtrar por UF (ID ou sigla) via índices invertidos pré-computados
     elif uf_id is not None:
-        for m in municipios:
-            microregiao = m.get("microrregiao")
-            if microregiao:
-                mesorregiao = microregiao.get("mesorregiao")
-                if mesorregiao:
-                    uf = mesorregiao.get("UF")
-                    if uf and uf.get("id") == uf_id:
-                        resultados.append(m)
-    
+        indices_resultado = _indices_municipios_por_uf()[0].get(uf_id, [])
+
     elif uf_sigla:
         uf_sigla_upper = uf_sigla.upper().strip()
-        for m in municipios:
-            microregiao = m.get("microrregiao")
-            if microregiao:
-                mesorregiao = microregiao.get("mesorregiao")
-                if mesorregiao:
-                    uf = mesorregiao.get("UF")
-                    if uf and uf.get("sigla") == uf_sigla_upper:
-                        resultados.append(m)
-    
+        indices_resultado = _indices_municipios_por_uf()[1].get(uf_sigla_upper, [])
+
     # Se nenhum filtro, retornar mensagem informativa
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "message": "Por favor, forneça ao menos um critério de busca (id, nome, uf_id ou uf_sigla)",
             "total_municipios": len(municipios)
-        }, ensure_ascii=False, indent=2)
-    
-    if resultados:
-        # Formatar resultados de forma mais compacta
-        municipios_formatados = []
-        for m in resultados:
-            uf = m.get("microrregiao", {}).get("mesorregiao", {}).get("UF", {})
-            municipios_formatados.append({
-                "id": m["id"],
-                "nome": m["nome"],
-                "uf": {
-                    "id": uf.get("id"),
-                    "sigla": uf.get("sigla"),
-                    "nome": uf.get("nome")
-                },
-                "microrregiao": m.get("microrregiao", {}).get("nome"),
-                "mesorregiao": m.get("microrregiao", {}).get("mesorregiao", {}).get("nome")
-            })
-        
-        return json.dumps({
+        })
+
+    if indices_resultado:
+        # A visão achatada já está no formato de resposta
+        return _dumps({
             "success": True,
-            "total_encontrados": len(resultados),
-            "municipios": municipios_formatados
-        }, ensure_ascii=False, indent=2)
+            "total_encontrados": len(indices_resultado),
+            "municipios": [view[idx] for idx in indices_resultado]
+        })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "message": "Nenhum município encontrado com os critérios especificados"
-        }, ensure_ascii=False, indent=2)
+        })
 
 
 def consultar_uf(
@@ -213,47 +400,95 @@ def consultar_uf(
     estados = carregar_estados_brasil()
     
     if not estados:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": "Não foi possível carregar os dados dos estados"
-        }, ensure_ascii=False, indent=2)
+        })
     
+    # Se nenhum filtro, retornar todos (resposta constante pré-serializada)
+    if id is None and not sigla and not nome and not regiao_nome:
+        return _todos_estados_json()
+
     resultados = []
-    
-    # Filtrar por ID
+
+    # Filtrar por ID via índice O(1)
     if id is not None:
-        resultados = [e for e in estados if e["id"] == id]
-    
-    # Filtrar por sigla
+        hit = _estados_por_id().get(id)
+        resultados = [hit] if hit else []
+
+    # Filtrar por sigla via índice O(1)
     elif sigla:
-        sigla_upper = sigla.upper().strip()
-        resultados = [e for e in estados if e["sigla"] == sigla_upper]
-    
-    # Filtrar por nome (busca parcial, case-insensitive)
+        hit = _estados_por_sigla().get(sigla.upper().strip())
+        resultados = [hit] if hit else []
+
+    # Filtrar por nome (busca parcial, case-insensitive, nomes pré-minusculizados)
     elif nome:
         nome_lower = nome.lower().strip()
-        resultados = [e for e in estados if nome_lower in e["nome"].lower()]
-    
-    # Filtrar por região
+        resultados = [e for e, (n, _) in zip(estados, _estados_nomes_lower()) if nome_lower in n]
+
+    # Filtrar por região (nomes pré-minusculizados)
     elif regiao_nome:
         regiao_lower = regiao_nome.lower().strip()
-        resultados = [e for e in estados if regiao_lower in e["regiao"]["nome"].lower()]
-    
-    # Se nenhum filtro, retornar todos
-    else:
-        resultados = estados
-    
+        resultados = [e for e, (_, r) in zip(estados, _estados_nomes_lower()) if regiao_lower in r]
+
     if resultados:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "total_encontrados": len(resultados),
             "estados": resultados
-        }, ensure_ascii=False, indent=2)
+        })
     else:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "message": "Nenhum estado encontrado com os critérios especificados"
-        }, ensure_ascii=False, indent=2)
+        })
+
+
+# Dict vazio compartilhado para os fallbacks de sub-dicionários ausentes
+_EMPTY: dict = {}
+
+
+def _formatar_edital(item: dict) -> dict:
+    """Formata um edital retornado pela API do PNCP de forma mais legível"""
+    # Sub-dicionários resolvidos uma única vez por item, ao invés de um
+    # item.get(...) aninhado por campo
+    orgao = item.get("orgaoEntidade") or _EMPTY
+    unidade = item.get("unidadeOrgao") or _EMPTY
+    amparo = item.get("amparoLegal") or _EMPTY
+    return {
+        "numero_controle_pncp": item.get("numeroControlePNCP"),
+        "numero_compra": item.get("numeroCompra"),
+        "processo": item.get("processo"),
+        "objeto": item.get("objetoCompra"),
+        "modalidade": item.get("modalidadeNome"),
+        "modo_disputa": item.get("modoDisputaNome"),
+        "situacao": item.get("situacaoCompraNome"),
+        "valor_estimado": item.get("valorTotalEstimado"),
+        "valor_homologado": item.get("valorTotalHomologado"),
+        "srp": item.get("srp"),  # Sistema de Registro de Preços
+        "data_abertura_proposta": item.get("dataAberturaProposta"),
+        "data_encerramento_proposta": item.get("dataEncerramentoProposta"),
+        "data_publicacao_pncp": item.get("dataPublicacaoPncp"),
+        "orgao_entidade": {
+            "cnpj": orgao.get("cnpj"),
+            "razao_social": orgao.get("razaoSocial"),
+            "poder": orgao.get("poderId"),
+            "esfera": orgao.get("esferaId")
+        },
+        "unidade_orgao": {
+            "nome": unidade.get("nomeUnidade"),
+            "municipio": unidade.get("municipioNome"),
+            "uf": unidade.get("ufSigla"),
+            "codigo_ibge": unidade.get("codigoIbge")
+        },
+        "amparo_legal": {
+            "nome": amparo.get("nome"),
+            "descricao": amparo.get("descricao")
+        },
+        "tipo_instrumento": item.get("tipoInstrumentoConvocatorioNome"),
+        "link_sistema_origem": item.get("linkSistemaOrigem"),
+        "informacao_complementar": item.get("informacaoComplementar")
+    }
 
 
 def consultar_editais_pncp(
@@ -263,11 +498,12 @@ def consultar_editais_pncp(
     uf: Optional[str] = None,
     cnpj: Optional[str] = None,
     codigo_modalidade: Optional[int] = None,
-    codigo_municipio_ibge: Optional[str] = None
+    codigo_municipio_ibge: Optional[str] = None,
+    resumo_apenas: bool = False
 ) -> str:
     """
     Consulta editais e avisos de contratações no Portal Nacional de Contratações Públicas (PNCP)
-    
+
     Args:
         data_final: Data final para busca no formato YYYYMMDD (ex: 20260220).
                    IMPORTANTE: Deve ser maior ou igual à data atual
@@ -277,7 +513,8 @@ def consultar_editais_pncp(
         cnpj: CNPJ do órgão/entidade (apenas números)
         codigo_modalidade: Código da modalidade de contratação
         codigo_municipio_ibge: Código IBGE do município
-    
+        resumo_apenas: Se True, retorna apenas os totais (sem a lista de editais)
+
     Returns:
         Dados dos editais em formato JSON string
     """
@@ -297,25 +534,28 @@ def consultar_editais_pncp(
         params["uf"] = uf.upper()
     
     if cnpj:
-        params["cnpj"] = cnpj.replace(".", "").replace("/", "").replace("-", "")
+        params["cnpj"] = cnpj.translate(_CNPJ_TABLE)
     
     if codigo_modalidade:
         params["codigoModalidadeContratacao"] = codigo_modalidade
     
     if codigo_municipio_ibge:
         params["codigoMunicipioIbge"] = codigo_municipio_ibge
-    
+
+    # Respostas recentes para os mesmos parâmetros saem direto do cache
+    cache_key = (resumo_apenas, *sorted(params.items()))
+    with _PNCP_CACHE_LOCK:
+        cached = _PNCP_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': '*/*',
-        }
-        
-        response = requests.get(api_url, params=params, headers=headers, timeout=30)
+        response = _SESSION.get(api_url, params=params, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
-            
+            itens = data.get("data") or []
+
             # Formatar resposta de forma mais legível
             result = {
                 "success": True,
@@ -324,57 +564,25 @@ def consultar_editais_pncp(
                 "total_paginas": data.get("totalPaginas", 0),
                 "pagina_atual": data.get("numeroPagina", pagina),
                 "paginas_restantes": data.get("paginasRestantes", 0),
-                "quantidade_resultados": len(data.get("data", [])),
-                "editais": []
+                "quantidade_resultados": len(itens),
             }
-            
-            # Processar cada edital
-            for item in data.get("data", []):
-                edital = {
-                    "numero_controle_pncp": item.get("numeroControlePNCP"),
-                    "numero_compra": item.get("numeroCompra"),
-                    "processo": item.get("processo"),
-                    "objeto": item.get("objetoCompra"),
-                    "modalidade": item.get("modalidadeNome"),
-                    "modo_disputa": item.get("modoDisputaNome"),
-                    "situacao": item.get("situacaoCompraNome"),
-                    "valor_estimado": item.get("valorTotalEstimado"),
-                    "valor_homologado": item.get("valorTotalHomologado"),
-                    "srp": item.get("srp"),  # Sistema de Registro de Preços
-                    "data_abertura_proposta": item.get("dataAberturaProposta"),
-                    "data_encerramento_proposta": item.get("dataEncerramentoProposta"),
-                    "data_publicacao_pncp": item.get("dataPublicacaoPncp"),
-                    "orgao_entidade": {
-                        "cnpj": item.get("orgaoEntidade", {}).get("cnpj"),
-                        "razao_social": item.get("orgaoEntidade", {}).get("razaoSocial"),
-                        "poder": item.get("orgaoEntidade", {}).get("poderId"),
-                        "esfera": item.get("orgaoEntidade", {}).get("esferaId")
-                    },
-                    "unidade_orgao": {
-                        "nome": item.get("unidadeOrgao", {}).get("nomeUnidade"),
-                        "municipio": item.get("unidadeOrgao", {}).get("municipioNome"),
-                        "uf": item.get("unidadeOrgao", {}).get("ufSigla"),
-                        "codigo_ibge": item.get("unidadeOrgao", {}).get("codigoIbge")
-                    },
-                    "amparo_legal": {
-                        "nome": item.get("amparoLegal", {}).get("nome"),
-                        "descricao": item.get("amparoLegal", {}).get("descricao")
-                    },
-                    "tipo_instrumento": item.get("tipoInstrumentoConvocatorioNome"),
-                    "link_sistema_origem": item.get("linkSistemaOrigem"),
-                    "informacao_complementar": item.get("informacaoComplementar")
-                }
-                
-                result["editais"].append(edital)
-            
-            return json.dumps(result, ensure_ascii=False, indent=2)
+
+            # Em modo resumo o chamador só quer os totais: pula a formatação
+            # item a item e devolve uma resposta pequena e barata de serializar
+            if not resumo_apenas:
+                result["editais"] = [_formatar_edital(item) for item in itens]
+
+            payload = _dumps(result)
+            with _PNCP_CACHE_LOCK:
+                _PNCP_CACHE[cache_key] = payload
+            return payload
         
         else:
             # Tentar obter detalhes do erro da resposta
             error_detail = ""
             try:
                 error_data = response.json()
-                error_detail = f"\nDetalhes: {json.dumps(error_data, ensure_ascii=False, indent=2)}"
+                error_detail = f"\nDetalhes: {_dumps(error_data)}"
             except:
                 error_detail = f"\nResposta: {response.text[:500]}"
             
@@ -385,7 +593,7 @@ def consultar_editais_pncp(
                 "message": f"Não foi possível obter os dados. Verifique os parâmetros e tente novamente.{error_detail}",
                 "parametros_enviados": params
             }
-            return json.dumps(error_result, ensure_ascii=False, indent=2)
+            return _dumps(error_result)
     
     except requests.exceptions.Timeout:
         error_result = {
@@ -393,7 +601,7 @@ def consultar_editais_pncp(
             "error": "Timeout na requisição",
             "message": "A API do PNCP demorou muito para responder. Tente novamente."
         }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+        return _dumps(error_result)
     
     except Exception as e:
         error_result = {
@@ -401,7 +609,205 @@ def consultar_editais_pncp(
             "error": str(e),
             "message": "Erro ao consultar a API do PNCP"
         }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+        return _dumps(error_result)
+
+
+async def aconsultar_editais_pncp(
+    data_final: str,
+    pagina: int = 1,
+    tamanho_pagina: int = 10,
+    uf: Optional[str] = None,
+    cnpj: Optional[str] = None,
+    codigo_modalidade: Optional[int] = None,
+    codigo_municipio_ibge: Optional[str] = None,
+    resumo_apenas: bool = False
+) -> str:
+    """
+    Variante assíncrona de consultar_editais_pncp
+
+    Usa o cliente httpx compartilhado (HTTP/2) para não bloquear o event loop
+    enquanto aguarda a API do PNCP; parâmetros e formato de resposta são
+    idênticos aos da versão síncrona, incluindo o cache com TTL.
+    """
+
+    api_url = "https://pncp.gov.br/api/consulta/v1/contratacoes/proposta"
+
+    tamanho_valido = max(10, min(tamanho_pagina, 500)) if tamanho_pagina else 10
+    params = {
+        "dataFinal": data_final,
+        "pagina": pagina,
+        "tamanhoPagina": tamanho_valido
+    }
+    if uf:
+        params["uf"] = uf.upper()
+    if cnpj:
+        params["cnpj"] = cnpj.translate(_CNPJ_TABLE)
+    if codigo_modalidade:
+        params["codigoModalidadeContratacao"] = codigo_modalidade
+    if codigo_municipio_ibge:
+        params["codigoMunicipioIbge"] = codigo_municipio_ibge
+
+    cache_key = (resumo_apenas, *sorted(params.items()))
+    with _PNCP_CACHE_LOCK:
+        cached = _PNCP_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await _ACLIENT.get(api_url, params=params)
+
+        if response.status_code == 200:
+            data = response.json()
+            itens = data.get("data") or []
+
+            result = {
+                "success": True,
+                "fonte": "Portal Nacional de Contratações Públicas (PNCP)",
+                "total_registros": data.get("totalRegistros", 0),
+                "total_paginas": data.get("totalPaginas", 0),
+                "pagina_atual": data.get("numeroPagina", pagina),
+                "paginas_restantes": data.get("paginasRestantes", 0),
+                "quantidade_resultados": len(itens),
+            }
+            if not resumo_apenas:
+                result["editais"] = [_formatar_edital(item) for item in itens]
+
+            payload = _dumps(result)
+            with _PNCP_CACHE_LOCK:
+                _PNCP_CACHE[cache_key] = payload
+            return payload
+
+        else:
+            error_detail = ""
+            try:
+                error_data = response.json()
+                error_detail = f"\nDetalhes: {_dumps(error_data)}"
+            except:
+                error_detail = f"\nResposta: {response.text[:500]}"
+
+            return _dumps({
+                "success": False,
+                "error": f"Erro na requisição à API do PNCP",
+                "status_code": response.status_code,
+                "message": f"Não foi possível obter os dados. Verifique os parâmetros e tente novamente.{error_detail}",
+                "parametros_enviados": params
+            })
+
+    except httpx.TimeoutException:
+        return _dumps({
+            "success": False,
+            "error": "Timeout na requisição",
+            "message": "A API do PNCP demorou muito para responder. Tente novamente."
+        })
+
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": str(e),
+            "message": "Erro ao consultar a API do PNCP"
+        })
+
+
+def consultar_editais_pncp_all(
+    data_final: str,
+    tamanho_pagina: int = 50,
+    uf: Optional[str] = None,
+    cnpj: Optional[str] = None,
+    codigo_modalidade: Optional[int] = None,
+    codigo_municipio_ibge: Optional[str] = None,
+    max_pages: int = 5
+) -> str:
+    """
+    Consulta múltiplas páginas de editais do PNCP com requisições concorrentes
+
+    A página 1 é buscada primeiro para descobrir o total de páginas; as
+    demais (até max_pages) são buscadas em paralelo sobre a sessão
+    compartilhada, com no máximo 6 requisições simultâneas para respeitar
+    os limites do portal. O tempo total escala com o tamanho do pool ao
+    invés de linearmente com o número de páginas.
+
+    Args:
+        data_final: Data final para busca no formato YYYYMMDD
+        tamanho_pagina: Quantidade de registros por página (mínimo: 10, máx: 500)
+        uf: Sigla do estado (ex: SP, RJ, MG)
+        cnpj: CNPJ do órgão/entidade (apenas números)
+        codigo_modalidade: Código da modalidade de contratação
+        codigo_municipio_ibge: Código IBGE do município
+        max_pages: Número máximo de páginas a buscar (padrão: 5)
+
+    Returns:
+        Dados agregados dos editais em formato JSON string
+    """
+
+    api_url = "https://pncp.gov.br/api/consulta/v1/contratacoes/proposta"
+
+    tamanho_valido = max(10, min(tamanho_pagina, 500)) if tamanho_pagina else 10
+    params = {
+        "dataFinal": data_final,
+        "pagina": 1,
+        "tamanhoPagina": tamanho_valido
+    }
+    if uf:
+        params["uf"] = uf.upper()
+    if cnpj:
+        params["cnpj"] = cnpj.translate(_CNPJ_TABLE)
+    if codigo_modalidade:
+        params["codigoModalidadeContratacao"] = codigo_modalidade
+    if codigo_municipio_ibge:
+        params["codigoMunicipioIbge"] = codigo_municipio_ibge
+
+    try:
+        # Página 1 primeiro, para descobrir quantas páginas existem
+        response = _SESSION.get(api_url, params=params, timeout=30)
+        if response.status_code != 200:
+            return _dumps({
+                "success": False,
+                "error": "Erro na requisição à API do PNCP",
+                "status_code": response.status_code,
+                "parametros_enviados": params
+            })
+
+        data = response.json()
+        total_paginas = data.get("totalPaginas", 0) or 1
+        itens = list(data.get("data", []))
+
+        ultima_pagina = min(total_paginas, max(1, max_pages))
+        if ultima_pagina > 1:
+            def _buscar(pagina: int):
+                return _SESSION.get(
+                    api_url, params={**params, "pagina": pagina}, timeout=30
+                )
+
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                respostas = executor.map(_buscar, range(2, ultima_pagina + 1))
+                # executor.map preserva a ordem das páginas
+                for resp in respostas:
+                    if resp.status_code == 200:
+                        itens.extend(resp.json().get("data", []))
+
+        return _dumps({
+            "success": True,
+            "fonte": "Portal Nacional de Contratações Públicas (PNCP)",
+            "total_registros": data.get("totalRegistros", 0),
+            "total_paginas": total_paginas,
+            "paginas_consultadas": ultima_pagina,
+            "quantidade_resultados": len(itens),
+            "editais": [_formatar_edital(item) for item in itens]
+        })
+
+    except requests.exceptions.Timeout:
+        return _dumps({
+            "success": False,
+            "error": "Timeout na requisição",
+            "message": "A API do PNCP demorou muito para responder. Tente novamente."
+        })
+
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": str(e),
+            "message": "Erro ao consultar a API do PNCP"
+        })
 
 
 def test_pncp_consultation():
@@ -522,6 +928,11 @@ class EditaisPNCPInput(BaseModel):
         default=None,
         description="Código IBGE do município para filtrar"
     )
+    resumo_apenas: bool = Field(
+        default=False,
+        description="Se True, retorna apenas os totais (total de registros e páginas), "
+                    "sem a lista detalhada de editais. Use quando só precisar de contagens."
+    )
 
 
 class ConsultaUFInput(BaseModel):
@@ -567,15 +978,7 @@ class ConsultaMunicipioInput(BaseModel):
     )
 
 
-class ConsultaModalidadeInput(BaseModel):
-    """Schema de entrada para a ferramenta de consulta de modalidades"""
-    nome: Optional[str] = Field(
-        default=None,
-        description="Nome completo ou parcial da modalidade (ex: 'Pregão', 'Eletrônico', 'Dispensa', 'Concorrência'). "
-                    "Se não especificado, retorna todas as modalidades disponíveis."
-    )
-
-
+@functools.lru_cache(maxsize=1)
 def create_editais_pncp_tool() -> StructuredTool:
     """Cria e retorna a ferramenta de consulta de editais do PNCP"""
     from ..prompts import prompt_loader
@@ -604,12 +1007,14 @@ def create_editais_pncp_tool() -> StructuredTool:
     
     return StructuredTool.from_function(
         func=consultar_editais_pncp,
+        coroutine=aconsultar_editais_pncp,
         name="ConsultarEditaisPNCP",
         description=enhanced_description,
         args_schema=EditaisPNCPInput
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_consulta_uf_tool() -> StructuredTool:
     """Cria e retorna a ferramenta de consulta de UF"""
     return StructuredTool.from_function(
@@ -625,6 +1030,7 @@ def create_consulta_uf_tool() -> StructuredTool:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_consulta_municipio_tool() -> StructuredTool:
     """Cria e retorna a ferramenta de consulta de municípios"""
     return StructuredTool.from_function(
@@ -639,20 +1045,6 @@ def create_consulta_municipio_tool() -> StructuredTool:
     )
 
 
-def create_consulta_modalidade_tool() -> StructuredTool:
-    """Cria e retorna a ferramenta de consulta de modalidades"""
-    return StructuredTool.from_function(
-        func=consultar_modalidade,
-        name="ConsultarModalidade",
-        description=(
-            "Consulta modalidades de contratação pública (Pregão, Concorrência, Dispensa, etc). "
-            "Retorna o CODIGO da modalidade que deve ser usado no parâmetro 'codigo_modalidade' da ferramenta ConsultarEditaisPNCP. "
-            "Sem parâmetros retorna todas as 10 modalidades."
-        ),
-        args_schema=ConsultaModalidadeInput
-    )
-
-
 def get_all_tools() -> list:
     """
     Retorna todas as ferramentas disponíveis para o agente
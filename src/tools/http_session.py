@@ -0,0 +1,45 @@
+"""
+Sessão HTTP compartilhada pelas ferramentas que consultam a API do PNCP
+"""
+import atexit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Sessão única por processo com pool de conexões keep-alive: o handshake
+# TCP+TLS com pncp.gov.br é amortizado entre as chamadas de ferramenta de
+# um mesmo turno e entre usuários. Erros transitórios de gateway (502/503/504)
+# são repetidos com backoff antes de virar erro para o agente.
+PNCP_SESSION = requests.Session()
+PNCP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+PNCP_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': '*/*',
+})
+
+# Cliente assíncrono compartilhado para as variantes async das ferramentas:
+# não bloqueia o event loop durante as chamadas ao portal e mantém um pool
+# de conexões keep-alive próprio
+PNCP_ASYNC_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    headers=dict(PNCP_SESSION.headers),
+)
+
+
+def _fechar_async_client():
+    """Fecha o cliente assíncrono compartilhado na saída do processo"""
+    import asyncio
+    try:
+        asyncio.run(PNCP_ASYNC_CLIENT.aclose())
+    except Exception:
+        pass
+
+
+atexit.register(_fechar_async_client)
@@ -2,72 +2,107 @@
 Ferramenta para consulta de Modalidades de Contratação Pública
 """
 from langchain_core.tools import StructuredTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
-import json
+import functools
+import os
+
+import orjson
+
+# Respostas compactas por padrão: o consumidor é o LLM, que não precisa de
+# JSON identado. Defina PNCP_TOOL_PRETTY=1 para saída identada em depuração.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | \
+    (orjson.OPT_INDENT_2 if os.getenv("PNCP_TOOL_PRETTY") == "1" else 0)
+
+
+def _dumps(obj) -> str:
+    """Serializa uma resposta de ferramenta (orjson, compacto por padrão)"""
+    return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+
+def _normalizar(texto: str) -> str:
+    """Normaliza para busca (remove hífens, espaços extras e converte para minúsculo)"""
+    return ' '.join(texto.replace('-', ' ').lower().split())
+
+
+# Mapeamento de modalidades de contratação do PNCP (dados estáticos)
+_MODALIDADES = [
+    {"codigo": 1, "nome": "Leilão - Eletrônico", "tipo": "Leilão"},
+    {"codigo": 4, "nome": "Concorrência - Eletrônica", "tipo": "Concorrência"},
+    {"codigo": 5, "nome": "Concorrência - Presencial", "tipo": "Concorrência"},
+    {"codigo": 6, "nome": "Pregão - Eletrônico", "tipo": "Pregão"},
+    {"codigo": 7, "nome": "Pregão - Presencial", "tipo": "Pregão"},
+    {"codigo": 8, "nome": "Dispensa", "tipo": "Dispensa"},
+    {"codigo": 9, "nome": "Inexigibilidade", "tipo": "Inexigibilidade"},
+    {"codigo": 11, "nome": "Pré-qualificação", "tipo": "Pré-qualificação"},
+    {"codigo": 12, "nome": "Credenciamento", "tipo": "Credenciamento"},
+    {"codigo": 13, "nome": "Leilão - Presencial", "tipo": "Leilão"},
+]
+
+# Formas normalizadas pré-computadas: (modalidade, nome_norm, tipo_norm, palavras do nome)
+_MODALIDADES_NORM = [
+    (m, _normalizar(m["nome"]), _normalizar(m["tipo"]), set(_normalizar(m["nome"]).split()))
+    for m in _MODALIDADES
+]
+
+
+# Respostas constantes pré-serializadas: sem filtro (ou sem resultado) a
+# resposta é sempre a mesma string, então não há motivo para re-serializar
+_ALL_MODALIDADES_JSON = _dumps({
+    "success": True,
+    "total_encontrados": len(_MODALIDADES),
+    "modalidades": _MODALIDADES
+})
+_NO_MATCH_MODALIDADE_JSON = _dumps({
+    "success": False,
+    "message": "Nenhuma modalidade encontrada com os critérios especificados",
+    "modalidades_disponiveis": _MODALIDADES
+})
 
 
 def obter_modalidades_contratacao():
     """Retorna o mapeamento de modalidades de contratação do PNCP"""
-    return [
-        {"codigo": 1, "nome": "Leilão - Eletrônico", "tipo": "Leilão"},
-        {"codigo": 4, "nome": "Concorrência - Eletrônica", "tipo": "Concorrência"},
-        {"codigo": 5, "nome": "Concorrência - Presencial", "tipo": "Concorrência"},
-        {"codigo": 6, "nome": "Pregão - Eletrônico", "tipo": "Pregão"},
-        {"codigo": 7, "nome": "Pregão - Presencial", "tipo": "Pregão"},
-        {"codigo": 8, "nome": "Dispensa", "tipo": "Dispensa"},
-        {"codigo": 9, "nome": "Inexigibilidade", "tipo": "Inexigibilidade"},
-        {"codigo": 11, "nome": "Pré-qualificação", "tipo": "Pré-qualificação"},
-        {"codigo": 12, "nome": "Credenciamento", "tipo": "Credenciamento"},
-        {"codigo": 13, "nome": "Leilão - Presencial", "tipo": "Leilão"},
-    ]
+    return _MODALIDADES
 
 
 def consultar_modalidade(nome: Optional[str] = None) -> str:
     """
     Consulta informações sobre modalidades de contratação do PNCP
-    
+
     Args:
         nome: Nome completo ou parcial da modalidade (ex: 'Pregão', 'Eletrônico', 'Dispensa')
-    
+
     Returns:
         Informações da(s) modalidade(s) em formato JSON string
     """
-    
-    modalidades = obter_modalidades_contratacao()
-    
-    if nome:
-        # Normalizar para busca (remover hífens, espaços extras e converter para minúsculo)
-        def normalizar(texto):
-            return ' '.join(texto.replace('-', ' ').lower().split())
-        
-        nome_normalizado = normalizar(nome)
-        resultados = [
-            m for m in modalidades 
-            if nome_normalizado in normalizar(m["nome"]) or 
-               nome_normalizado in normalizar(m["tipo"]) or
-               any(palavra in normalizar(m["nome"]) for palavra in nome_normalizado.split())
-        ]
-    else:
-        # Se não especificar filtro, retornar todas
-        resultados = modalidades
-    
+
+    if not nome:
+        # Se não especificar filtro, retornar todas (resposta pré-serializada)
+        return _ALL_MODALIDADES_JSON
+
+    nome_normalizado = _normalizar(nome)
+    palavras = set(nome_normalizado.split())
+    resultados = [
+        m for m, nome_norm, tipo_norm, palavras_nome in _MODALIDADES_NORM
+        if nome_normalizado in nome_norm or
+           nome_normalizado in tipo_norm or
+           not palavras.isdisjoint(palavras_nome)
+    ]
+
     if resultados:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "total_encontrados": len(resultados),
             "modalidades": resultados
-        }, ensure_ascii=False, indent=2)
+        })
     else:
-        return json.dumps({
-            "success": False,
-            "message": "Nenhuma modalidade encontrada com os critérios especificados",
-            "modalidades_disponiveis": modalidades
-        }, ensure_ascii=False, indent=2)
+        return _NO_MATCH_MODALIDADE_JSON
 
 
 class ConsultaModalidadeInput(BaseModel):
     """Schema de entrada para a ferramenta de consulta de modalidades"""
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     nome: Optional[str] = Field(
         default=None,
         description="Nome completo ou parcial da modalidade (ex: 'Pregão', 'Eletrônico', 'Dispensa', 'Concorrência'). "
@@ -75,8 +110,9 @@ class ConsultaModalidadeInput(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_consulta_modalidade_tool() -> StructuredTool:
-    """Cria e retorna a ferramenta de consulta de modalidades"""
+    """Cria e retorna a ferramenta de consulta de modalidades (instância única)"""
     return StructuredTool.from_function(
         func=consultar_modalidade,
         name="ConsultarModalidade",
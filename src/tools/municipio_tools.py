@@ -2,25 +2,207 @@
 Ferramenta para consulta de Municípios do Brasil
 """
 from langchain_core.tools import StructuredTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
-import json
+from collections import defaultdict
+import bisect
+import functools
+import os
+import sys
+import unicodedata
+
+import orjson
 from pathlib import Path
 
+# orjson serializa/deserializa em C, 2-5x mais rápido que o módulo json e já
+# nativo em UTF-8 (sem escapes de acentos). Respostas compactas por padrão:
+# o consumidor é o LLM, que não precisa de JSON identado (a indentação quase
+# dobra os bytes — e os tokens — de cada resposta de ferramenta). Defina
+# PNCP_TOOL_PRETTY=1 para saída identada em depuração.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | \
+    (orjson.OPT_INDENT_2 if os.getenv("PNCP_TOOL_PRETTY") == "1" else 0)
+
+
+def _dumps(obj) -> str:
+    """Serializa uma resposta de ferramenta com orjson"""
+    return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+
+# Dict vazio compartilhado para os fallbacks de sub-dicionários ausentes
+_EMPTY: dict = {}
+
+# Respostas constantes serializadas uma única vez na carga do módulo:
+# os caminhos de erro/miss não pagam o serializador a cada chamada
+_ERRO_CARGA_JSON = _dumps({
+    "success": False,
+    "error": "Não foi possível carregar os dados dos municípios"
+})
+_SEM_RESULTADO_JSON = _dumps({
+    "success": False,
+    "message": "Nenhum município encontrado com os critérios especificados"
+})
+
+
+def _fold(texto: str) -> str:
+    """Minusculiza e remove acentos ('São Paulo' -> 'sao paulo') para busca"""
+    return ''.join(
+        c for c in unicodedata.normalize('NFKD', texto.lower())
+        if not unicodedata.combining(c)
+    )
 
+
+@functools.lru_cache(maxsize=1)
 def carregar_municipios_brasil():
-    """Carrega os dados dos municípios brasileiros do arquivo JSON"""
+    """
+    Carrega os dados dos municípios brasileiros do arquivo JSON
+
+    O resultado é memoizado: o arquivo tem milhares de entradas estáticas e o
+    parse acontece uma única vez por processo, não a cada chamada de ferramenta.
+
+    A cadeia microrregiao -> mesorregiao -> UF é desnormalizada em chaves
+    planas (_uf_id, _uf_sigla, _uf_nome, _micro_nome, _meso_nome) uma única
+    vez na carga: filtros e formatação fazem um acesso direto por linha ao
+    invés de 3-4 gets aninhados.
+    """
     try:
         # Caminho relativo ao arquivo atual
         current_dir = Path(__file__).parent
         json_path = current_dir.parent / "data" / "municipios.json"
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        with open(json_path, 'rb') as f:
+            municipios = orjson.loads(f.read())
+
+        # As siglas e nomes de UF vêm de um vocabulário de 27 valores que se
+        # repete pelas ~5.5k linhas: sys.intern garante um único objeto str
+        # por valor, e as comparações nos índices viram igualdade de ponteiro
+        for m in municipios:
+            micro = m.get("microrregiao") or _EMPTY
+            meso = micro.get("mesorregiao") or _EMPTY
+            uf = meso.get("UF") or _EMPTY
+            sigla = uf.get("sigla")
+            nome_uf = uf.get("nome")
+            m["_uf_id"] = uf.get("id")
+            m["_uf_sigla"] = sys.intern(sigla) if sigla else sigla
+            m["_uf_nome"] = sys.intern(nome_uf) if nome_uf else nome_uf
+            m["_micro_nome"] = micro.get("nome")
+            m["_meso_nome"] = meso.get("nome")
+
+        return municipios
     except Exception as e:
         return []
 
 
+@functools.lru_cache(maxsize=1)
+def _nomes_municipios_folded():
+    """
+    Lista paralela a carregar_municipios_brasil() com os nomes já minúsculos
+    e sem acentos: 'sao paulo' encontra 'São Paulo' e a busca não refaz a
+    normalização Unicode de ~5.5k nomes por chamada.
+    """
+    return [_fold(m["nome"]) for m in carregar_municipios_brasil()]
+
+
+@functools.lru_cache(maxsize=1)
+def _blob_nomes_municipios():
+    """
+    Empacota todos os nomes normalizados (minúsculos, sem acentos) em um
+    único buffer de bytes separado por NUL, com a lista de offsets iniciais
+    de cada nome.
+
+    A busca por substring vira chamadas a bytes.find — uma varredura em C
+    sobre memória contígua ao invés de ~5.5k iterações do interpretador com
+    um `in` por nome.
+    """
+    encoded = [n.encode() for n in _nomes_municipios_folded()]
+    offsets = []
+    pos = 0
+    for nome in encoded:
+        offsets.append(pos)
+        pos += len(nome) + 1  # +1 pelo separador NUL
+    return b"\x00".join(encoded), offsets
+
+
+def _busca_nomes(nome: str, limite: int) -> list:
+    """
+    Retorna até `limite` índices de municípios cujo nome contém a substring
+    (ignorando caixa e acentos), na ordem do dataset, usando busca C-level
+    no buffer único de nomes. A consulta é normalizada uma única vez.
+    """
+    blob, offsets = _blob_nomes_municipios()
+    agulha = _fold(nome.strip()).encode()
+    resultados = []
+    anterior = -1
+    pos = blob.find(agulha)
+    while pos != -1:
+        idx = bisect.bisect_right(offsets, pos) - 1
+        if idx != anterior:
+            resultados.append(idx)
+            if len(resultados) == limite:
+                break
+            anterior = idx
+        pos = blob.find(agulha, pos + 1)
+    return resultados
+
+
+@functools.lru_cache(maxsize=1)
+def _municipios_formatados():
+    """
+    Coluna paralela ao dataset com as linhas já no formato de resposta da
+    ferramenta (layout colunar: o dataset vira estruturas paralelas — nomes
+    normalizados, buffer de bytes e esta projeção — e os filtros selecionam
+    índices de linha; só as linhas selecionadas são materializadas, por
+    indexação direta, sem reconstruir dicts por consulta).
+    """
+    return [
+        {
+            "id": m["id"],
+            "nome": m["nome"],
+            "uf": {
+                "id": m["_uf_id"],
+                "sigla": m["_uf_sigla"],
+                "nome": m["_uf_nome"]
+            },
+            "microrregiao": m["_micro_nome"],
+            "mesorregiao": m["_meso_nome"]
+        }
+        for m in carregar_municipios_brasil()
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _sem_filtro_json() -> str:
+    """
+    Resposta pré-serializada para chamadas sem nenhum filtro: o total de
+    municípios é fixo por processo, então a mensagem é montada uma única vez.
+    """
+    return _dumps({
+        "success": False,
+        "message": "Por favor, forneça ao menos um critério de busca (id, nome, uf_id ou uf_sigla)",
+        "total_municipios": len(carregar_municipios_brasil())
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _municipios_por_id():
+    """Índice {codigo_ibge: índice da linha} para lookup O(1) por id"""
+    return {m["id"]: i for i, m in enumerate(carregar_municipios_brasil())}
+
+
+@functools.lru_cache(maxsize=1)
+def _municipios_por_uf():
+    """
+    Índices invertidos {uf_id: [índices]} e {uf_sigla: [índices]} sobre as
+    chaves planas; as consultas por UF não varrem todos os municípios.
+    """
+    por_id = defaultdict(list)
+    por_sigla = defaultdict(list)
+    for i, m in enumerate(carregar_municipios_brasil()):
+        if m["_uf_id"] is not None:
+            por_id[m["_uf_id"]].append(i)
+            por_sigla[m["_uf_sigla"]].append(i)
+    return dict(por_id), dict(por_sigla)
+
+
 def consultar_municipio(
     id: Optional[int] = None,
     nome: Optional[str] = None,
@@ -43,86 +225,52 @@ def consultar_municipio(
     municipios = carregar_municipios_brasil()
     
     if not municipios:
-        return json.dumps({
-            "success": False,
-            "error": "Não foi possível carregar os dados dos municípios"
-        }, ensure_ascii=False, indent=2)
-    
-    resultados = []
-    
-    # Filtrar por ID (código IBGE)
+        return _ERRO_CARGA_JSON
+
+    indices = []
+
+    # Filtrar por ID (código IBGE) via índice O(1)
     if id is not None:
-        resultados = [m for m in municipios if m["id"] == id]
-    
-    # Filtrar por nome (busca parcial, case-insensitive)
+        hit = _municipios_por_id().get(id)
+        indices = [hit] if hit is not None else []
+
+    # Filtrar por nome (busca parcial ignorando caixa e acentos, varredura
+    # C-level sobre o buffer único de nomes, limitada a 50 resultados)
     elif nome:
-        nome_lower = nome.lower().strip()
-        resultados = [m for m in municipios if nome_lower in m["nome"].lower()]
-        # Limitar resultados para evitar retornar muitos municípios
-        if len(resultados) > 50:
-            resultados = resultados[:50]
-    
-    # Filtrar por UF (ID ou sigla)
+        indices = _busca_nomes(nome, 50)
+
+    # Filtrar por UF (ID ou sigla) via índices invertidos pré-computados
     elif uf_id is not None:
-        for m in municipios:
-            microregiao = m.get("microrregiao")
-            if microregiao:
-                mesorregiao = microregiao.get("mesorregiao")
-                if mesorregiao:
-                    uf = mesorregiao.get("UF")
-                    if uf and uf.get("id") == uf_id:
-                        resultados.append(m)
-    
+        indices = _municipios_por_uf()[0].get(uf_id, [])
+
     elif uf_sigla:
         uf_sigla_upper = uf_sigla.upper().strip()
-        for m in municipios:
-            microregiao = m.get("microrregiao")
-            if microregiao:
-                mesorregiao = microregiao.get("mesorregiao")
-                if mesorregiao:
-                    uf = mesorregiao.get("UF")
-                    if uf and uf.get("sigla") == uf_sigla_upper:
-                        resultados.append(m)
-    
-    # Se nenhum filtro, retornar mensagem informativa
+        indices = _municipios_por_uf()[1].get(uf_sigla_upper, [])
+
+    # Se nenhum filtro, retornar mensagem informativa (pré-serializada)
     else:
-        return json.dumps({
-            "success": False,
-            "message": "Por favor, forneça ao menos um critério de busca (id, nome, uf_id ou uf_sigla)",
-            "total_municipios": len(municipios)
-        }, ensure_ascii=False, indent=2)
-    
-    if resultados:
-        # Formatar resultados de forma mais compacta
-        municipios_formatados = []
-        for m in resultados:
-            uf = m.get("microrregiao", {}).get("mesorregiao", {}).get("UF", {})
-            municipios_formatados.append({
-                "id": m["id"],
-                "nome": m["nome"],
-                "uf": {
-                    "id": uf.get("id"),
-                    "sigla": uf.get("sigla"),
-                    "nome": uf.get("nome")
-                },
-                "microrregiao": m.get("microrregiao", {}).get("nome"),
-                "mesorregiao": m.get("microrregiao", {}).get("mesorregiao", {}).get("nome")
-            })
-        
-        return json.dumps({
+        return _sem_filtro_json()
+
+    if indices:
+        # Materializar apenas as linhas selecionadas, por indexação direta
+        # na projeção pré-formatada (os dicts de resposta são construídos
+        # uma única vez por processo, não a cada consulta)
+        view = _municipios_formatados()
+        municipios_formatados = [view[i] for i in indices]
+
+        return _dumps({
             "success": True,
-            "total_encontrados": len(resultados),
+            "total_encontrados": len(indices),
             "municipios": municipios_formatados
-        }, ensure_ascii=False, indent=2)
+        })
     else:
-        return json.dumps({
-            "success": False,
-            "message": "Nenhum município encontrado com os critérios especificados"
-        }, ensure_ascii=False, indent=2)
+        return _SEM_RESULTADO_JSON
 
 
 class ConsultaMunicipioInput(BaseModel):
     """Schema de entrada para a ferramenta de consulta de municípios"""
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     id: Optional[int] = Field(
         default=None,
         description="Código IBGE do município (ex: 3550308 para São Paulo/SP, 3304557 para Rio de Janeiro/RJ)"
@@ -144,8 +292,9 @@ class ConsultaMunicipioInput(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_consulta_municipio_tool() -> StructuredTool:
-    """Cria e retorna a ferramenta de consulta de municípios"""
+    """Cria e retorna a ferramenta de consulta de municípios (instância única)"""
     return StructuredTool.from_function(
         func=consultar_municipio,
         name="ConsultarMunicipio",
@@ -2,12 +2,181 @@
 Ferramenta para consulta ao Portal Nacional de Contratações Públicas (PNCP)
 """
 from langchain_core.tools import StructuredTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+import asyncio
+import functools
+import logging
+import os
+import threading
+import httpx
+import orjson
 import requests
+from cachetools import TTLCache
 from typing import Optional
-import json
 from datetime import datetime, timedelta
 
+from .http_session import PNCP_SESSION, PNCP_ASYNC_CLIENT
+
+_API_URL = "https://pncp.gov.br/api/consulta/v1/contratacoes/proposta"
+
+# Logger do módulo: os detalhes de cada requisição saem em nível DEBUG com
+# formatação %-style preguiçosa — quando DEBUG está desligado (produção),
+# nem a mensagem nem o repr dos parâmetros são construídos, e o caminho
+# quente não faz I/O em stdout
+log = logging.getLogger(__name__)
+
+# Tabela de tradução para limpar CNPJs formatados em uma única passada
+# (cnpj.translate(_CNPJ_TABLE) ao invés de três .replace encadeados)
+_CNPJ_TABLE = str.maketrans("", "", "./-")
+
+# orjson serializa/deserializa em C, 2-5x mais rápido que o módulo json e já
+# nativo em UTF-8 (sem escapes de acentos). Respostas compactas por padrão:
+# o consumidor é o LLM, que não precisa de JSON identado (a indentação quase
+# dobra os bytes — e os tokens — de cada resposta de ferramenta). Defina
+# PNCP_TOOL_PRETTY=1 para saída identada em depuração.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | \
+    (orjson.OPT_INDENT_2 if os.getenv("PNCP_TOOL_PRETTY") == "1" else 0)
+
+
+def _dumps(obj) -> str:
+    """Serializa uma resposta de ferramenta com orjson"""
+    return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+
+# Cache de respostas com TTL: o agente re-emite a mesma consulta com
+# frequência dentro de uma sessão, e os dados do portal mudam devagar.
+# Apenas respostas 200 são cacheadas; erros sempre repetem a requisição.
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=300)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+# Dict vazio compartilhado para os fallbacks de sub-dicionários ausentes
+_EMPTY: dict = {}
+
+
+def _extrair_orgao(orgao: dict) -> dict:
+    """Projeta o sub-dicionário orgaoEntidade no formato da resposta"""
+    return {
+        "cnpj": orgao.get("cnpj"),
+        "razao_social": orgao.get("razaoSocial"),
+        "poder": orgao.get("poderId"),
+        "esfera": orgao.get("esferaId")
+    }
+
+
+def _extrair_unidade(unidade: dict) -> dict:
+    """Projeta o sub-dicionário unidadeOrgao no formato da resposta"""
+    return {
+        "nome": unidade.get("nomeUnidade"),
+        "municipio": unidade.get("municipioNome"),
+        "uf": unidade.get("ufSigla"),
+        "codigo_ibge": unidade.get("codigoIbge")
+    }
+
+
+def _extrair_amparo(amparo: dict) -> dict:
+    """Projeta o sub-dicionário amparoLegal no formato da resposta"""
+    return {
+        "nome": amparo.get("nome"),
+        "descricao": amparo.get("descricao")
+    }
+
+
+def _formatar_edital(item: dict) -> dict:
+    """Formata um edital retornado pela API do PNCP de forma mais legível"""
+    # Sub-dicionários resolvidos uma única vez por item, ao invés de um
+    # item.get(...) aninhado (com um {} descartável) por campo
+    orgao = item.get("orgaoEntidade") or _EMPTY
+    unidade = item.get("unidadeOrgao") or _EMPTY
+    amparo = item.get("amparoLegal") or _EMPTY
+    return {
+        "numero_controle_pncp": item.get("numeroControlePNCP"),
+        "numero_compra": item.get("numeroCompra"),
+        "processo": item.get("processo"),
+        "objeto": item.get("objetoCompra"),
+        "modalidade": item.get("modalidadeNome"),
+        "modo_disputa": item.get("modoDisputaNome"),
+        "situacao": item.get("situacaoCompraNome"),
+        "valor_estimado": item.get("valorTotalEstimado"),
+        "valor_homologado": item.get("valorTotalHomologado"),
+        "srp": item.get("srp"),  # Sistema de Registro de Preços
+        "data_abertura_proposta": item.get("dataAberturaProposta"),
+        "data_encerramento_proposta": item.get("dataEncerramentoProposta"),
+        "data_publicacao_pncp": item.get("dataPublicacaoPncp"),
+        "orgao_entidade": _extrair_orgao(orgao),
+        "unidade_orgao": _extrair_unidade(unidade),
+        "amparo_legal": _extrair_amparo(amparo),
+        "tipo_instrumento": item.get("tipoInstrumentoConvocatorioNome"),
+        "link_sistema_origem": item.get("linkSistemaOrigem"),
+        "informacao_complementar": item.get("informacaoComplementar")
+    }
+
+
+# Tabela de despacho campo da resposta -> extrator sobre o item bruto da
+# API, espelhando _formatar_edital. Com a whitelist `campos`, só os
+# extratores pedidos rodam por linha — pedir um único campo custa um get
+# por item ao invés da montagem dos ~25 campos
+_CAMPOS_EDITAL = {
+    "numero_controle_pncp": lambda item: item.get("numeroControlePNCP"),
+    "numero_compra": lambda item: item.get("numeroCompra"),
+    "processo": lambda item: item.get("processo"),
+    "objeto": lambda item: item.get("objetoCompra"),
+    "modalidade": lambda item: item.get("modalidadeNome"),
+    "modo_disputa": lambda item: item.get("modoDisputaNome"),
+    "situacao": lambda item: item.get("situacaoCompraNome"),
+    "valor_estimado": lambda item: item.get("valorTotalEstimado"),
+    "valor_homologado": lambda item: item.get("valorTotalHomologado"),
+    "srp": lambda item: item.get("srp"),
+    "data_abertura_proposta": lambda item: item.get("dataAberturaProposta"),
+    "data_encerramento_proposta": lambda item: item.get("dataEncerramentoProposta"),
+    "data_publicacao_pncp": lambda item: item.get("dataPublicacaoPncp"),
+    "orgao_entidade": lambda item: _extrair_orgao(item.get("orgaoEntidade") or _EMPTY),
+    "unidade_orgao": lambda item: _extrair_unidade(item.get("unidadeOrgao") or _EMPTY),
+    "amparo_legal": lambda item: _extrair_amparo(item.get("amparoLegal") or _EMPTY),
+    "tipo_instrumento": lambda item: item.get("tipoInstrumentoConvocatorioNome"),
+    "link_sistema_origem": lambda item: item.get("linkSistemaOrigem"),
+    "informacao_complementar": lambda item: item.get("informacaoComplementar")
+}
+
+
+def _extratores_campos(campos: Optional[list]):
+    """
+    Resolve a whitelist `campos` em pares (nome, extrator) uma única vez por
+    consulta; nomes desconhecidos são ignorados. Retorna None quando não há
+    whitelist (caminho comum: formatação completa via _formatar_edital).
+    """
+    if not campos:
+        return None
+    extratores = [(c, _CAMPOS_EDITAL[c]) for c in campos if c in _CAMPOS_EDITAL]
+    return extratores or None
+
+
+def _montar_params(
+    data_final: str,
+    pagina: int,
+    tamanho_pagina: int,
+    uf: Optional[str],
+    cnpj: Optional[str],
+    codigo_modalidade: Optional[int],
+    codigo_municipio_ibge: Optional[str]
+) -> dict:
+    """Constrói os parâmetros da requisição (API exige tamanhoPagina >= 10)"""
+    tamanho_valido = max(10, min(tamanho_pagina, 500)) if tamanho_pagina else 10
+    params = {
+        "dataFinal": data_final,
+        "pagina": pagina,
+        "tamanhoPagina": tamanho_valido
+    }
+    if uf:
+        params["uf"] = uf.upper()
+    if cnpj:
+        params["cnpj"] = cnpj.translate(_CNPJ_TABLE)
+    if codigo_modalidade:
+        params["codigoModalidadeContratacao"] = codigo_modalidade
+    if codigo_municipio_ibge:
+        params["codigoMunicipioIbge"] = codigo_municipio_ibge
+    return params
+
 
 def consultar_editais_pncp(
     data_final: str,
@@ -16,7 +185,8 @@ def consultar_editais_pncp(
     uf: Optional[str] = None,
     cnpj: Optional[str] = None,
     codigo_modalidade: Optional[int] = None,
-    codigo_municipio_ibge: Optional[str] = None
+    codigo_municipio_ibge: Optional[str] = None,
+    campos: Optional[list] = None
 ) -> str:
     """
     Consulta editais e avisos de contratações no Portal Nacional de Contratações Públicas (PNCP)
@@ -30,112 +200,70 @@ def consultar_editais_pncp(
         cnpj: CNPJ do órgão/entidade (apenas números)
         codigo_modalidade: Código da modalidade de contratação
         codigo_municipio_ibge: Código IBGE do município
-    
+        campos: Whitelist de campos a retornar por edital (ex: ['numero_controle_pncp',
+                'objeto']); se omitido, retorna todos os campos
+
     Returns:
         Dados dos editais em formato JSON string
     """
-    
-    api_url = "https://pncp.gov.br/api/consulta/v1/contratacoes/proposta"
-    
-    # Construir parâmetros da requisição (API exige tamanhoPagina >= 10)
-    tamanho_valido = max(10, min(tamanho_pagina, 500)) if tamanho_pagina else 10
-    
-    params = {
-        "dataFinal": data_final,
-        "pagina": pagina,
-        "tamanhoPagina": tamanho_valido
-    }
-    
-    if uf:
-        params["uf"] = uf.upper()
-    
-    if cnpj:
-        params["cnpj"] = cnpj.replace(".", "").replace("/", "").replace("-", "")
-    
-    if codigo_modalidade:
-        params["codigoModalidadeContratacao"] = codigo_modalidade
-    
-    if codigo_municipio_ibge:
-        params["codigoMunicipioIbge"] = codigo_municipio_ibge
-    
+
+    api_url = _API_URL
+    params = _montar_params(
+        data_final, pagina, tamanho_pagina, uf, cnpj,
+        codigo_modalidade, codigo_municipio_ibge
+    )
+    extratores = _extratores_campos(campos)
+
+    # Consultas repetidas com os mesmos parâmetros saem direto do cache
+    # (a whitelist de campos faz parte da chave: respostas completas e
+    # projetadas não se misturam)
+    chave_campos = tuple(c for c, _ in extratores) if extratores else None
+    cache_key = (chave_campos, *sorted(params.items()))
+    with _RESPONSE_CACHE_LOCK:
+        cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': '*/*',
-        }
-        
-        # Log da URL completa sendo chamada
-        print(f"\n🌐 URL da API: {api_url}")
-        print(f"📋 Parâmetros (camelCase): {params}")
-        
-        response = requests.get(api_url, params=params, headers=headers, timeout=30)
-        
-        # Log da URL final com query string
-        print(f"🔗 Request URL completa: {response.url}")
-        print(f"📊 Status Code: {response.status_code}")
-        
+        log.debug("URL da API: %s | Parâmetros (camelCase): %s", api_url, params)
+
+        # Sessão compartilhada: reaproveita conexões keep-alive com o PNCP
+        response = PNCP_SESSION.get(api_url, params=params, timeout=30)
+
+        log.debug("Request URL completa: %s | Status Code: %s",
+                  response.url, response.status_code)
+
+
         if response.status_code == 200:
-            data = response.json()
-            
-            # Formatar resposta de forma mais legível
-            result = {
+            data = orjson.loads(response.content)
+            itens = data.get("data") or []
+
+            # Serializa direto do literal: sem dict intermediário nem loop de
+            # append — a lista de editais nasce por list comprehension dentro
+            # do próprio objeto passado ao orjson
+            payload = _dumps({
                 "success": True,
                 "fonte": "Portal Nacional de Contratações Públicas (PNCP)",
                 "total_registros": data.get("totalRegistros", 0),
                 "total_paginas": data.get("totalPaginas", 0),
                 "pagina_atual": data.get("numeroPagina", pagina),
                 "paginas_restantes": data.get("paginasRestantes", 0),
-                "quantidade_resultados": len(data.get("data", [])),
-                "editais": []
-            }
-            
-            # Processar cada edital
-            for item in data.get("data", []):
-                edital = {
-                    "numero_controle_pncp": item.get("numeroControlePNCP"),
-                    "numero_compra": item.get("numeroCompra"),
-                    "processo": item.get("processo"),
-                    "objeto": item.get("objetoCompra"),
-                    "modalidade": item.get("modalidadeNome"),
-                    "modo_disputa": item.get("modoDisputaNome"),
-                    "situacao": item.get("situacaoCompraNome"),
-                    "valor_estimado": item.get("valorTotalEstimado"),
-                    "valor_homologado": item.get("valorTotalHomologado"),
-                    "srp": item.get("srp"),  # Sistema de Registro de Preços
-                    "data_abertura_proposta": item.get("dataAberturaProposta"),
-                    "data_encerramento_proposta": item.get("dataEncerramentoProposta"),
-                    "data_publicacao_pncp": item.get("dataPublicacaoPncp"),
-                    "orgao_entidade": {
-                        "cnpj": item.get("orgaoEntidade", {}).get("cnpj"),
-                        "razao_social": item.get("orgaoEntidade", {}).get("razaoSocial"),
-                        "poder": item.get("orgaoEntidade", {}).get("poderId"),
-                        "esfera": item.get("orgaoEntidade", {}).get("esferaId")
-                    },
-                    "unidade_orgao": {
-                        "nome": item.get("unidadeOrgao", {}).get("nomeUnidade"),
-                        "municipio": item.get("unidadeOrgao", {}).get("municipioNome"),
-                        "uf": item.get("unidadeOrgao", {}).get("ufSigla"),
-                        "codigo_ibge": item.get("unidadeOrgao", {}).get("codigoIbge")
-                    },
-                    "amparo_legal": {
-                        "nome": item.get("amparoLegal", {}).get("nome"),
-                        "descricao": item.get("amparoLegal", {}).get("descricao")
-                    },
-                    "tipo_instrumento": item.get("tipoInstrumentoConvocatorioNome"),
-                    "link_sistema_origem": item.get("linkSistemaOrigem"),
-                    "informacao_complementar": item.get("informacaoComplementar")
-                }
-                
-                result["editais"].append(edital)
-            
-            return json.dumps(result, ensure_ascii=False, indent=2)
-        
+                "quantidade_resultados": len(itens),
+                "editais": [
+                    {c: fn(item) for c, fn in extratores}
+                    for item in itens
+                ] if extratores else [_formatar_edital(item) for item in itens]
+            })
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[cache_key] = payload
+            return payload
+
         else:
             # Tentar obter detalhes do erro da resposta
             error_detail = ""
             try:
-                error_data = response.json()
-                error_detail = f"\nDetalhes: {json.dumps(error_data, ensure_ascii=False, indent=2)}"
+                error_data = orjson.loads(response.content)
+                error_detail = f"\nDetalhes: {_dumps(error_data)}"
             except:
                 error_detail = f"\nResposta: {response.text[:500]}"
             
@@ -146,7 +274,7 @@ def consultar_editais_pncp(
                 "message": f"Não foi possível obter os dados. Verifique os parâmetros e tente novamente.{error_detail}",
                 "parametros_enviados": params
             }
-            return json.dumps(error_result, ensure_ascii=False, indent=2)
+            return _dumps(error_result)
     
     except requests.exceptions.Timeout:
         error_result = {
@@ -154,7 +282,7 @@ def consultar_editais_pncp(
             "error": "Timeout na requisição",
             "message": "A API do PNCP demorou muito para responder. Tente novamente."
         }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+        return _dumps(error_result)
     
     except Exception as e:
         error_result = {
@@ -162,7 +290,159 @@ def consultar_editais_pncp(
             "error": str(e),
             "message": "Erro ao consultar a API do PNCP"
         }
-        return json.dumps(error_result, ensure_ascii=False, indent=2)
+        return _dumps(error_result)
+
+
+async def aconsultar_editais_pncp(
+    data_final: str,
+    pagina: int = 1,
+    tamanho_pagina: int = 10,
+    uf: Optional[str] = None,
+    cnpj: Optional[str] = None,
+    codigo_modalidade: Optional[int] = None,
+    codigo_municipio_ibge: Optional[str] = None,
+    campos: Optional[list] = None
+) -> str:
+    """
+    Variante assíncrona de consultar_editais_pncp
+
+    Usa o cliente httpx compartilhado para não bloquear o event loop enquanto
+    aguarda a API do PNCP; parâmetros e formato de resposta são idênticos aos
+    da versão síncrona.
+    """
+
+    params = _montar_params(
+        data_final, pagina, tamanho_pagina, uf, cnpj,
+        codigo_modalidade, codigo_municipio_ibge
+    )
+    extratores = _extratores_campos(campos)
+
+    chave_campos = tuple(c for c, _ in extratores) if extratores else None
+    cache_key = (chave_campos, *sorted(params.items()))
+    with _RESPONSE_CACHE_LOCK:
+        cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await PNCP_ASYNC_CLIENT.get(_API_URL, params=params)
+
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            itens = data.get("data") or []
+
+            payload = _dumps({
+                "success": True,
+                "fonte": "Portal Nacional de Contratações Públicas (PNCP)",
+                "total_registros": data.get("totalRegistros", 0),
+                "total_paginas": data.get("totalPaginas", 0),
+                "pagina_atual": data.get("numeroPagina", pagina),
+                "paginas_restantes": data.get("paginasRestantes", 0),
+                "quantidade_resultados": len(itens),
+                "editais": [
+                    {c: fn(item) for c, fn in extratores}
+                    for item in itens
+                ] if extratores else [_formatar_edital(item) for item in itens]
+            })
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[cache_key] = payload
+            return payload
+
+        else:
+            error_detail = ""
+            try:
+                error_data = orjson.loads(response.content)
+                error_detail = f"\nDetalhes: {_dumps(error_data)}"
+            except:
+                error_detail = f"\nResposta: {response.text[:500]}"
+
+            return _dumps({
+                "success": False,
+                "error": f"Erro na requisição à API do PNCP",
+                "status_code": response.status_code,
+                "message": f"Não foi possível obter os dados. Verifique os parâmetros e tente novamente.{error_detail}",
+                "parametros_enviados": params
+            })
+
+    except httpx.TimeoutException:
+        return _dumps({
+            "success": False,
+            "error": "Timeout na requisição",
+            "message": "A API do PNCP demorou muito para responder. Tente novamente."
+        })
+
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": str(e),
+            "message": "Erro ao consultar a API do PNCP"
+        })
+
+
+async def consultar_editais_pncp_batch(
+    data_final: str,
+    paginas: list,
+    tamanho_pagina: int = 10,
+    uf: Optional[str] = None,
+    cnpj: Optional[str] = None,
+    codigo_modalidade: Optional[int] = None,
+    codigo_municipio_ibge: Optional[str] = None
+) -> str:
+    """
+    Consulta várias páginas de editais do PNCP em paralelo
+
+    As requisições são disparadas concorrentemente com asyncio.gather sobre
+    o cliente compartilhado: N páginas completam em ~1 RTT ao invés de N.
+
+    Args:
+        data_final: Data final para busca no formato YYYYMMDD
+        paginas: Números das páginas a buscar (ex: [1, 2, 3])
+        tamanho_pagina: Quantidade de registros por página (mínimo: 10, máx: 500)
+        uf: Sigla do estado (ex: SP, RJ, MG)
+        cnpj: CNPJ do órgão/entidade (apenas números)
+        codigo_modalidade: Código da modalidade de contratação
+        codigo_municipio_ibge: Código IBGE do município
+
+    Returns:
+        Dados agregados dos editais em formato JSON string
+    """
+
+    try:
+        respostas = await asyncio.gather(*[
+            PNCP_ASYNC_CLIENT.get(_API_URL, params=_montar_params(
+                data_final, pagina, tamanho_pagina, uf, cnpj,
+                codigo_modalidade, codigo_municipio_ibge
+            ))
+            for pagina in paginas
+        ], return_exceptions=True)
+
+        itens = []
+        total_registros = 0
+        total_paginas = 0
+        for resposta in respostas:
+            if isinstance(resposta, Exception) or resposta.status_code != 200:
+                continue
+            data = orjson.loads(resposta.content)
+            itens.extend(data.get("data", []))
+            total_registros = data.get("totalRegistros", total_registros)
+            total_paginas = data.get("totalPaginas", total_paginas)
+
+        return _dumps({
+            "success": True,
+            "fonte": "Portal Nacional de Contratações Públicas (PNCP)",
+            "total_registros": total_registros,
+            "total_paginas": total_paginas,
+            "paginas_consultadas": list(paginas),
+            "quantidade_resultados": len(itens),
+            "editais": [_formatar_edital(item) for item in itens]
+        })
+
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": str(e),
+            "message": "Erro ao consultar a API do PNCP"
+        })
 
 
 def test_pncp_consultation():
@@ -194,7 +474,7 @@ def test_pncp_consultation():
     
     # Parse do JSON para análise
     try:
-        data = json.loads(result)
+        data = orjson.loads(result)
         
         if data.get("success"):
             print(f"\n✅ Sucesso! {data['total_registros']} editais encontrados no total")
@@ -242,9 +522,9 @@ def test_pncp_consultation():
                 print(f"Status Code: {data['status_code']}")
             if 'parametros_enviados' in data:
                 print(f"\n📋 Parâmetros enviados:")
-                print(json.dumps(data['parametros_enviados'], ensure_ascii=False, indent=2))
+                print(_dumps(data['parametros_enviados']))
     
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print("\n❌ Erro ao decodificar JSON")
         print(result)
     
@@ -253,6 +533,11 @@ def test_pncp_consultation():
 
 class EditaisPNCPInput(BaseModel):
     """Schema de entrada para a ferramenta de consulta de editais do PNCP"""
+    # Instâncias imutáveis e campos extras ignorados (ao invés de erro de
+    # validação quando o LLM inventa um argumento); strings chegam sem
+    # espaços nas pontas, dispensando .strip() no caminho da consulta
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     data_final: str = Field(
         description="Data final para busca no formato YYYYMMDD (ex: 20260220). "
                     "IMPORTANTE: Deve ser maior ou igual à data atual."
@@ -283,10 +568,26 @@ class EditaisPNCPInput(BaseModel):
         default=None,
         description="Código IBGE do município para filtrar"
     )
+    campos: Optional[list[str]] = Field(
+        default=None,
+        description="Lista de campos a retornar por edital quando só parte da resposta "
+                    "interessa (ex: ['numero_controle_pncp', 'objeto', 'valor_estimado']). "
+                    "Se omitido, retorna todos os campos. Campos disponíveis: "
+                    "numero_controle_pncp, numero_compra, processo, objeto, modalidade, "
+                    "modo_disputa, situacao, valor_estimado, valor_homologado, srp, "
+                    "data_abertura_proposta, data_encerramento_proposta, data_publicacao_pncp, "
+                    "orgao_entidade, unidade_orgao, amparo_legal, tipo_instrumento, "
+                    "link_sistema_origem, informacao_complementar."
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def create_editais_pncp_tool() -> StructuredTool:
-    """Cria e retorna a ferramenta de consulta de editais do PNCP"""
+    """
+    Cria e retorna a ferramenta de consulta de editais do PNCP (instância
+    única: a leitura dos prompts e a montagem da descrição acontecem uma
+    vez por processo, não a cada fábrica de agente)
+    """
     from ..prompts import prompt_loader
     
     tool_prompts = prompt_loader.get_tool_prompts()
@@ -313,6 +614,7 @@ def create_editais_pncp_tool() -> StructuredTool:
     
     return StructuredTool.from_function(
         func=consultar_editais_pncp,
+        coroutine=aconsultar_editais_pncp,
         name="ConsultarEditaisPNCP",
         description=enhanced_description,
         args_schema=EditaisPNCPInput
@@ -2,25 +2,122 @@
 Ferramenta para consulta de Unidades Federativas (Estados) do Brasil
 """
 from langchain_core.tools import StructuredTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
-import json
+import functools
+import os
+import sys
+import unicodedata
+
+import orjson
 from pathlib import Path
 
+# orjson serializa/deserializa em C, 2-5x mais rápido que o módulo json e já
+# nativo em UTF-8 (sem escapes de acentos). Respostas compactas por padrão:
+# o consumidor é o LLM, que não precisa de JSON identado (a indentação quase
+# dobra os bytes — e os tokens — de cada resposta de ferramenta). Defina
+# PNCP_TOOL_PRETTY=1 para saída identada em depuração.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | \
+    (orjson.OPT_INDENT_2 if os.getenv("PNCP_TOOL_PRETTY") == "1" else 0)
+
+
+def _dumps(obj) -> str:
+    """Serializa uma resposta de ferramenta com orjson"""
+    return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+
+# Respostas constantes serializadas uma única vez na carga do módulo
+_ERRO_CARGA_JSON = _dumps({
+    "success": False,
+    "error": "Não foi possível carregar os dados dos estados"
+})
+_SEM_RESULTADO_JSON = _dumps({
+    "success": False,
+    "message": "Nenhum estado encontrado com os critérios especificados"
+})
+
 
+@functools.lru_cache(maxsize=1)
 def carregar_estados_brasil():
-    """Carrega os dados dos estados brasileiros do arquivo JSON"""
+    """
+    Carrega os dados dos estados brasileiros do arquivo JSON
+
+    O resultado é memoizado: os dados são estáticos e o parse do arquivo
+    acontece uma única vez por processo, não a cada chamada de ferramenta.
+    """
     try:
         # Caminho relativo ao arquivo atual
         current_dir = Path(__file__).parent
         json_path = current_dir.parent / "data" / "estados_brasil.json"
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(json_path, 'rb') as f:
+            estados = orjson.loads(f.read())
+
+        # Interna o vocabulário fixo (27 siglas/nomes, 5 regiões): as
+        # comparações de chave nos índices downstream viram igualdade de
+        # ponteiro ao invés de comparação caractere a caractere
+        for e in estados:
+            e["sigla"] = sys.intern(e["sigla"])
+            e["nome"] = sys.intern(e["nome"])
+            e["regiao"]["nome"] = sys.intern(e["regiao"]["nome"])
+
+        return estados
     except Exception as e:
         return []
 
 
+@functools.lru_cache(maxsize=1)
+def _estados_por_id():
+    """Índice {id: estado} para lookup O(1) por id"""
+    return {e["id"]: e for e in carregar_estados_brasil()}
+
+
+@functools.lru_cache(maxsize=1)
+def _estados_por_sigla():
+    """Índice {sigla: estado} para lookup O(1) por sigla"""
+    return {e["sigla"]: e for e in carregar_estados_brasil()}
+
+
+def _fold(texto: str) -> str:
+    """Minusculiza e remove acentos ('Pará' -> 'para') para busca"""
+    return ''.join(
+        c for c in unicodedata.normalize('NFKD', texto.lower())
+        if not unicodedata.combining(c)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _nomes_estados_folded():
+    """
+    Lista paralela a carregar_estados_brasil() com os nomes já minúsculos e
+    sem acentos: 'ceara' encontra 'Ceará' sem normalizar por chamada.
+    """
+    return [_fold(e["nome"]) for e in carregar_estados_brasil()]
+
+
+@functools.lru_cache(maxsize=1)
+def _todos_estados_json() -> str:
+    """
+    Resposta pré-serializada para a listagem completa (chamada sem filtros):
+    os 27 estados são estáticos, então o JSON é montado uma única vez.
+    """
+    estados = carregar_estados_brasil()
+    return _dumps({
+        "success": True,
+        "total_encontrados": len(estados),
+        "estados": estados
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _estados_por_regiao():
+    """Índice {regiao (minúscula): [estados]} para listagem O(k) por região"""
+    por_regiao = {}
+    for e in carregar_estados_brasil():
+        por_regiao.setdefault(e["regiao"]["nome"].lower(), []).append(e)
+    return por_regiao
+
+
 def consultar_uf(
     id: Optional[int] = None,
     sigla: Optional[str] = None,
@@ -43,51 +140,59 @@ def consultar_uf(
     estados = carregar_estados_brasil()
     
     if not estados:
-        return json.dumps({
-            "success": False,
-            "error": "Não foi possível carregar os dados dos estados"
-        }, ensure_ascii=False, indent=2)
-    
+        return _ERRO_CARGA_JSON
+
     resultados = []
-    
-    # Filtrar por ID
+
+    # Filtrar por ID via índice O(1)
     if id is not None:
-        resultados = [e for e in estados if e["id"] == id]
-    
-    # Filtrar por sigla
+        hit = _estados_por_id().get(id)
+        resultados = [hit] if hit else []
+
+    # Filtrar por sigla via índice O(1)
     elif sigla:
-        sigla_upper = sigla.upper().strip()
-        resultados = [e for e in estados if e["sigla"] == sigla_upper]
-    
-    # Filtrar por nome (busca parcial, case-insensitive)
+        hit = _estados_por_sigla().get(sigla.upper().strip())
+        resultados = [hit] if hit else []
+
+    # Filtrar por nome (busca parcial ignorando caixa e acentos, nomes
+    # pré-normalizados; a consulta é normalizada uma única vez)
     elif nome:
-        nome_lower = nome.lower().strip()
-        resultados = [e for e in estados if nome_lower in e["nome"].lower()]
-    
-    # Filtrar por região
+        nome_folded = _fold(nome.strip())
+        resultados = [
+            e for e, n in zip(estados, _nomes_estados_folded())
+            if nome_folded in n
+        ]
+
+    # Filtrar por região via índice (mantendo a busca parcial sobre as chaves)
     elif regiao_nome:
         regiao_lower = regiao_nome.lower().strip()
-        resultados = [e for e in estados if regiao_lower in e["regiao"]["nome"].lower()]
-    
-    # Se nenhum filtro, retornar todos
+        por_regiao = _estados_por_regiao()
+        resultados = por_regiao.get(regiao_lower)
+        if resultados is None:
+            resultados = [
+                e for chave, grupo in por_regiao.items()
+                if regiao_lower in chave
+                for e in grupo
+            ]
+
+    # Se nenhum filtro, retornar todos (resposta pré-serializada)
     else:
-        resultados = estados
-    
+        return _todos_estados_json()
+
     if resultados:
-        return json.dumps({
+        return _dumps({
             "success": True,
             "total_encontrados": len(resultados),
             "estados": resultados
-        }, ensure_ascii=False, indent=2)
+        })
     else:
-        return json.dumps({
-            "success": False,
-            "message": "Nenhum estado encontrado com os critérios especificados"
-        }, ensure_ascii=False, indent=2)
+        return _SEM_RESULTADO_JSON
 
 
 class ConsultaUFInput(BaseModel):
     """Schema de entrada para a ferramenta de consulta de UF"""
+    model_config = ConfigDict(extra='ignore', frozen=True, str_strip_whitespace=True)
+
     id: Optional[int] = Field(
         default=None,
         description="ID do estado brasileiro (ex: 35 para São Paulo, 33 para Rio de Janeiro)"
@@ -106,8 +211,9 @@ class ConsultaUFInput(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_consulta_uf_tool() -> StructuredTool:
-    """Cria e retorna a ferramenta de consulta de UF"""
+    """Cria e retorna a ferramenta de consulta de UF (instância única)"""
     return StructuredTool.from_function(
         func=consultar_uf,
         name="ConsultarUF",